@@ -1,5 +1,6 @@
 from enum import Enum
-from threading import Thread, Lock, Condition
+from queue import Full, Queue
+from threading import Thread
 import time
 
 class Direction(Enum):
@@ -17,23 +18,19 @@ class Elevator:
         self.capacity = capacity
         self.current_floor = 1
         self.current_direction = Direction.UP
-        self.requests = []
-        self.lock = Lock()
-        self.condition = Condition(self.lock)
+        self.requests = Queue(maxsize=capacity)
         self.running = True
 
     def add_request(self, request: Request):
-        with self.lock:
-            if len(self.requests) < self.capacity:
-                self.requests.append(request)
-                print(f"Elevator {self.id} queued request: {request.source_floor}→{request.destination_floor}")
-                self.condition.notify_all()
+        try:
+            self.requests.put_nowait(request)
+        except Full:
+            return
+        print(f"Elevator {self.id} queued request: {request.source_floor}→{request.destination_floor}")
 
     def get_next_request(self) -> Request:
-        with self.lock:
-            while self.running and not self.requests:
-                self.condition.wait()
-            return self.requests.pop(0) if self.requests else None
+        # Blocks until a request arrives; stop() unblocks it with a None sentinel
+        return self.requests.get()
 
     def move_to_floor(self, target_floor: int):
         while self.current_floor != target_floor and self.running:
@@ -69,9 +66,11 @@ class Elevator:
                 self.process_request(request)
 
     def stop(self):
-        with self.lock:
-            self.running = False
-            self.condition.notify_all()
+        self.running = False
+        try:
+            self.requests.put_nowait(None)
+        except Full:
+            pass  # not blocked in get(); run() sees running is False after its current request
 
 class ElevatorController:
     def __init__(self, num_elevators: int, capacity: int):
@@ -85,9 +84,10 @@ class ElevatorController:
             optimal_elevator.add_request(Request(source_floor, destination_floor))
 
     def find_optimal_elevator(self, source_floor: int) -> Elevator:
-        with self.elevators[0].lock:  # Lock for consistent state comparison
-            return min(self.elevators, 
-                      key=lambda e: (abs(e.current_floor - source_floor), len(e.requests)))
+        # Plain int reads are atomic under the GIL; locking one elevator never made the
+        # comparison across all of them consistent, it only stalled that elevator's thread
+        snapshot = [(abs(e.current_floor - source_floor), e.requests.qsize(), e.id, e) for e in self.elevators]
+        return min(snapshot)[-1]
 
     def shutdown(self):
         for elevator in self.elevators:
@@ -149,7 +149,7 @@ class Room:
         Changes the room status to BOOKED if it's AVAILABLE.
         """
         with self.lock:
-            if self.status == RoomStatus.AVAILABLE:
+            if self.status is RoomStatus.AVAILABLE:
                 self.status = RoomStatus.BOOKED
             else:
                 raise ValueError("Room is not available for booking.")
@@ -159,7 +159,7 @@ class Room:
         Changes the room status to OCCUPIED if it's BOOKED.
         """
         with self.lock:
-            if self.status == RoomStatus.BOOKED:
+            if self.status is RoomStatus.BOOKED:
                 self.status = RoomStatus.OCCUPIED
             else:
                 raise ValueError("Room is not booked.")
@@ -169,7 +169,7 @@ class Room:
         Changes the room status to AVAILABLE if it's OCCUPIED.
         """
         with self.lock:
-            if self.status == RoomStatus.OCCUPIED:
+            if self.status is RoomStatus.OCCUPIED:
                 self.status = RoomStatus.AVAILABLE
             else:
                 raise ValueError("Room is not occupied.")
@@ -204,7 +204,7 @@ class Reservation:
         Cancels the reservation (if it is still CONFIRMED) and frees the room.
         """
         with self.lock:
-            if self.status == ReservationStatus.CONFIRMED:
+            if self.status is ReservationStatus.CONFIRMED:
                 self.status = ReservationStatus.CANCELLED
                 self.room.check_out()  # Mark the room as AVAILABLE
             else:
@@ -254,7 +254,7 @@ class HotelManagementSystem:
         Reserves a room if it is AVAILABLE and returns the Reservation object.
         """
         with self.lock:
-            if room.status == RoomStatus.AVAILABLE:
+            if room.status is RoomStatus.AVAILABLE:
                 room.book()
                 reservation_id = self._generate_reservation_id()
                 reservation = Reservation(
@@ -284,7 +284,7 @@ class HotelManagementSystem:
         """
         with self.lock:
             reservation = self.reservations.get(reservation_id)
-            if reservation and reservation.status == ReservationStatus.CONFIRMED:
+            if reservation and reservation.status is ReservationStatus.CONFIRMED:
                 reservation.room.check_in()
             else:
                 raise ValueError("Invalid reservation or reservation not confirmed.")
@@ -295,7 +295,7 @@ class HotelManagementSystem:
         """
         with self.lock:
             reservation = self.reservations.get(reservation_id)
-            if reservation and reservation.status == ReservationStatus.CONFIRMED:
+            if reservation and reservation.status is ReservationStatus.CONFIRMED:
                 room = reservation.room
                 # Calculate price based on the number of days
                 days_stayed = (reservation.check_out_date - reservation.check_in_date).days
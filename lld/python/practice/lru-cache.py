@@ -1,4 +1,6 @@
 class Node:
+    __slots__ = ('key', 'value', 'prev', 'next')
+
     def __init__(self, key, value):
         self.key = key
         self.value = value
@@ -7,6 +9,8 @@ class Node:
 
 
 class LRUCache:
+    __slots__ = ('capacity', 'cache', 'head', 'tail')
+
     def __init__(self, capacity):
         if capacity <= 0:
             raise ValueError("Capacity must be a positive integer")
@@ -18,24 +22,39 @@ class LRUCache:
         self.tail.prev = self.head
 
     def get(self, key):
-        if key in self.cache:
-            node = self.cache[key]
-            self._move_to_head(node)
-            return node.value
-        return None
+        node = self.cache.get(key)
+        if node is None:
+            return None
+        # _move_to_head inlined: unlink, then relink right after the dummy head
+        prev, nxt = node.prev, node.next
+        prev.next = nxt
+        nxt.prev = prev
+        head = self.head
+        first = head.next
+        node.prev = head
+        node.next = first
+        first.prev = node
+        head.next = node
+        return node.value
 
     def put(self, key, value):
-        if key in self.cache:
-            node = self.cache[key]
+        cache = self.cache
+        node = cache.get(key)
+        if node is not None:
             node.value = value
             self._move_to_head(node)
+            return
+        if len(cache) >= self.capacity:
+            # Recycle the evicted node instead of allocating a new one, so a full cache
+            # allocates nothing on a miss
+            node = self._remove_tail()
+            del cache[node.key]
+            node.key = key
+            node.value = value
         else:
-            if len(self.cache) >= self.capacity:
-                removed_node = self._remove_tail()
-                del self.cache[removed_node.key]
-            new_node = Node(key, value)
-            self.cache[key] = new_node
-            self._add_to_head(new_node)
+            node = Node(key, value)
+        cache[key] = node
+        self._add_to_head(node)
 
     def _add_to_head(self, node):
         node.prev = self.head
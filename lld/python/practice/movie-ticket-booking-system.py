@@ -1,10 +1,10 @@
 from enum import Enum
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Union
 import threading
 from abc import ABC, abstractmethod
 from collections import defaultdict
-import itertools
+import functools
 
 # -------------------- Enums --------------------
 class BookingStatus(Enum):
@@ -63,23 +63,20 @@ class Seat:
         self._type = seat_type
         self._price = price
         self._status = SeatStatus.AVAILABLE
-        self._lock = threading.Lock()
 
+    # Not thread-safe on their own: callers hold the owning Show's lock
     def reserve(self):
-        with self._lock:
-            if self._status != SeatStatus.AVAILABLE:
-                raise SeatNotAvailableError(f"Seat {self._id} not available")
-            self._status = SeatStatus.RESERVED
+        if self._status is not SeatStatus.AVAILABLE:
+            raise SeatNotAvailableError(f"Seat {self._id} not available")
+        self._status = SeatStatus.RESERVED
 
     def confirm(self):
-        with self._lock:
-            if self._status != SeatStatus.RESERVED:
-                raise InvalidBookingStateError("Seat not in reserved state")
-            self._status = SeatStatus.BOOKED
+        if self._status is not SeatStatus.RESERVED:
+            raise InvalidBookingStateError("Seat not in reserved state")
+        self._status = SeatStatus.BOOKED
 
     def release(self):
-        with self._lock:
-            self._status = SeatStatus.AVAILABLE
+        self._status = SeatStatus.AVAILABLE
 
     @property
     def status(self) -> SeatStatus:
@@ -91,28 +88,40 @@ class Show:
         self._movie = movie
         self._theater = theater
         self._time = time
-        self._seats: Dict[str, Seat] = {}
+        # Seats in one dense list for scans, plus seat id -> position for lookups
+        self._seat_list: List[Seat] = []
+        self._seat_index: Dict[str, int] = {}
         self._lock = threading.Lock()
 
     def add_seats(self, seats: List[Seat]):
         with self._lock:
             for seat in seats:
-                self._seats[seat._id] = seat
+                self._seat_index[seat._id] = len(self._seat_list)
+                self._seat_list.append(seat)
 
     def get_available_seats(self) -> List[Seat]:
         with self._lock:
-            return [seat for seat in self._seats.values() if seat.status == SeatStatus.AVAILABLE]
+            return [seat for seat in self._seat_list if seat._status is SeatStatus.AVAILABLE]
 
     def reserve_seats(self, seat_ids: List[str]) -> List[Seat]:
+        # Resolve ids before taking the lock; only the status check and flip need it
+        # The flip below can't catch a seat listed twice, so reject that up front
+        if len(set(seat_ids)) != len(seat_ids):
+            raise ValueError("Duplicate seat ids in request")
+        seats = []
+        for seat_id in seat_ids:
+            index = self._seat_index.get(seat_id)
+            if index is None:
+                raise ValueError(f"Seat {seat_id} not found")
+            seats.append(self._seat_list[index])
         with self._lock:
-            seats = []
-            for seat_id in seat_ids:
-                if seat_id not in self._seats:
-                    raise ValueError(f"Seat {seat_id} not found")
-                seat = self._seats[seat_id]
-                seat.reserve()
-                seats.append(seat)
-            return seats
+            # Validate every seat first so a failed request leaves nothing reserved
+            for seat in seats:
+                if seat._status is not SeatStatus.AVAILABLE:
+                    raise SeatNotAvailableError(f"Seat {seat._id} not available")
+            for seat in seats:
+                seat._status = SeatStatus.RESERVED
+        return seats
 
 class Theater:
     def __init__(self, theater_id: str, name: str, location: str):
@@ -130,25 +139,28 @@ class Booking:
         self._user = user
         self._show = show
         self._seats = seats
+        self._total = sum([seat._price for seat in seats])  # fixed once the seats are held
         self._status = BookingStatus.PENDING
         self._created_at = datetime.now()
         self._lock = threading.Lock()
 
     def confirm(self):
         with self._lock:
-            if self._status != BookingStatus.PENDING:
+            if self._status is not BookingStatus.PENDING:
                 raise InvalidBookingStateError("Booking already processed")
-            for seat in self._seats:
-                seat.confirm()
+            with self._show._lock:
+                for seat in self._seats:
+                    seat.confirm()
             self._status = BookingStatus.CONFIRMED
 
     def cancel(self):
         with self._lock:
-            if self._status == BookingStatus.CANCELLED:
+            if self._status is BookingStatus.CANCELLED:
                 return
             self._status = BookingStatus.CANCELLED
-            for seat in self._seats:
-                seat.release()
+            with self._show._lock:
+                for seat in self._seats:
+                    seat.release()
 
 # -------------------- Patterns --------------------
 # Singleton Pattern for Booking System
@@ -167,8 +179,9 @@ class MovieTicketBookingSystem:
         self._movies: Dict[str, Movie] = {}
         self._theaters: Dict[str, Theater] = {}
         self._shows: Dict[str, Show] = {}
-        self._bookings: Dict[str, Booking] = {}
-        self._booking_counter = itertools.count(1)
+        # Booking ids are sequential, so booking "BKG-n" lives at index n - 1
+        self._bookings: List[Booking] = []
+        self._bookings_lock = threading.Lock()
         self._payment_processor: PaymentProcessor = CreditCardProcessor()
 
     # Strategy Pattern for payment processing
@@ -181,19 +194,27 @@ class MovieTicketBookingSystem:
         except SeatNotAvailableError as e:
             raise e
 
-        booking_id = f"BKG-{next(self._booking_counter):06d}"
-        booking = Booking(booking_id, user, show, seats)
-        self._bookings[booking_id] = booking
+        with self._bookings_lock:
+            idx = len(self._bookings)
+            booking = Booking(f"BKG-{idx + 1:06d}", user, show, seats)
+            self._bookings.append(booking)
         return booking
 
-    def confirm_booking(self, booking_id: str, payment_details: Dict):
-        booking = self._bookings.get(booking_id)
-        if not booking:
+    def _get_booking(self, booking_id: Union[int, str]) -> Booking:
+        if isinstance(booking_id, str):
+            if not booking_id.startswith("BKG-") or not booking_id[4:].isdigit():
+                raise ValueError("Invalid booking ID")
+            booking_id = int(booking_id[4:]) - 1
+        if not 0 <= booking_id < len(self._bookings):
             raise ValueError("Invalid booking ID")
+        return self._bookings[booking_id]
+
+    def confirm_booking(self, booking_id: Union[int, str], payment_details: Dict):
+        # Accepts the booking's index or its display id
+        booking = self._get_booking(booking_id)
         
         try:
-            amount = sum(seat._price for seat in booking._seats)
-            if self._payment_processor.process_payment(amount, payment_details):
+            if self._payment_processor.process_payment(booking._total, payment_details):
                 booking.confirm()
         except Exception as e:
             booking.cancel()
@@ -211,17 +232,22 @@ class CreditCardProcessor(PaymentProcessor):
         return True
 
 # Factory Pattern for Seat Creation
+# (seat_id, row, seat_type, price) per seat for a given geometry, built once and reused
+# by every show with the same layout
+@functools.lru_cache(maxsize=32)
+def _seat_template(rows: int, seats_per_row: int) -> tuple:
+    template = []
+    for row in range(1, rows + 1):
+        seat_type = SeatType.PREMIUM if row <= 2 else SeatType.NORMAL
+        price = 200 if seat_type is SeatType.PREMIUM else 150
+        row_prefix = f"{row}-"
+        template.extend((row_prefix + str(seat_num), row, seat_type, price) for seat_num in range(1, seats_per_row + 1))
+    return tuple(template)
+
 class SeatFactory:
     @staticmethod
     def create_seats(rows: int, seats_per_row: int) -> List[Seat]:
-        seats = []
-        for row in range(1, rows + 1):
-            seat_type = SeatType.PREMIUM if row <= 2 else SeatType.NORMAL
-            price = 200 if seat_type == SeatType.PREMIUM else 150
-            for seat_num in range(1, seats_per_row + 1):
-                seat_id = f"{row}-{seat_num}"
-                seats.append(Seat(seat_id, row, seat_type, price))
-        return seats
+        return [Seat(*spec) for spec in _seat_template(rows, seats_per_row)]
 
 # -------------------- Demo --------------------
 if __name__ == "__main__":
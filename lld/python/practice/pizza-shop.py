@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from enum import Enum
+from operator import attrgetter
 from typing import List, Dict
 
 # ----------------------
@@ -55,6 +56,8 @@ class Topping(Enum):
     OLIVES = 1.50
     ANCHOVIES = 3.00
 
+_topping_value = attrgetter('value')
+
 class Pizza:
     def __init__(self, name: str, base_price: float):
         self.name = name
@@ -64,7 +67,7 @@ class Pizza:
         self.toppings: List[Topping] = []
 
     def calculate_cost(self) -> float:
-        topping_cost = sum(t.value for t in self.toppings)
+        topping_cost = sum(map(_topping_value, self.toppings))
         return self.base_price + topping_cost + self.size.value
 
     def __str__(self):
@@ -188,14 +191,17 @@ class Order:
         self.pizzas: List[Pizza] = []
         self.customer = customer
         self._observers: List[OrderObserver] = [customer]
+        # Bound update methods, rebuilt on attach so notify just calls each one
+        self._callbacks = (customer.update,)
         self.payment_strategy: PaymentStrategy = None
 
     def attach(self, observer: OrderObserver):
         self._observers.append(observer)
+        self._callbacks += (observer.update,)
 
     def notify(self):
-        for observer in self._observers:
-            observer.update(self)
+        for callback in self._callbacks:
+            callback(self)
 
     def process_order(self):
         self.state.process_order(self)
@@ -206,7 +212,7 @@ class Order:
         self.notify()
 
     def total_cost(self) -> float:
-        return sum(p.calculate_cost() for p in self.pizzas)
+        return sum(map(Pizza.calculate_cost, self.pizzas))
 
     def process_payment(self) -> bool:
         if self.payment_strategy:
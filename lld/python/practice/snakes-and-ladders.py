@@ -9,16 +9,20 @@
 # This adheres to good object-oriented design principles: each class is responsible for a cohesive set of behaviors.
 # (Optional) Threading / Concurrency
 
-# The GameManager launches each game in its own thread. While not strictly a "design pattern," it demonstrates concurrent design where multiple games can run in parallel.
+# The GameManager runs each game on a shared thread pool. While not strictly a "design pattern," it demonstrates concurrent design where multiple games can run in parallel.
 
+import os
 import random
 import threading
+from concurrent.futures import ThreadPoolExecutor
 
 class Snake:
     """
     Represents a snake on the board with a start and end position.
     If a player lands on 'start', they go down to 'end'.
     """
+    __slots__ = ('start', 'end')
+
     def __init__(self, start, end):
         self.start = start
         self.end = end
@@ -35,6 +39,8 @@ class Ladder:
     Represents a ladder on the board with a start and end position.
     If a player lands on 'start', they climb up to 'end'.
     """
+    __slots__ = ('start', 'end')
+
     def __init__(self, start, end):
         self.start = start
         self.end = end
@@ -58,6 +64,10 @@ class Board:
         self.snakes = []
         self.ladders = []
         self._initialize_snakes_and_ladders()
+        # Start -> end of every snake and ladder, built once since the board never changes
+        self._jumps = {jump.get_start(): jump.get_end() for jump in self.snakes + self.ladders}
+        # Where each square 0..BOARD_SIZE actually leaves you, for the silent simulation
+        self.landing = [self._jumps.get(square, square) for square in range(Board.BOARD_SIZE + 1)]
 
     def _initialize_snakes_and_ladders(self):
         # Initialize snakes
@@ -83,15 +93,7 @@ class Board:
         If 'position' matches the start of any snake or ladder,
         return the end of that snake/ladder. Otherwise return the original position.
         """
-        for snake in self.snakes:
-            if snake.get_start() == position:
-                return snake.get_end()
-
-        for ladder in self.ladders:
-            if ladder.get_start() == position:
-                return ladder.get_end()
-
-        return position
+        return self._jumps.get(position, position)
 
 
 class Dice:
@@ -100,15 +102,29 @@ class Dice:
     """
     MIN_VALUE = 1
     MAX_VALUE = 6
+    BATCH_SIZE = 64
+    FACES = range(MIN_VALUE, MAX_VALUE + 1)
+
+    def __init__(self):
+        # Pre-drawn rolls, one byte each, and the next one to hand out
+        self._buf = b""
+        self._idx = 0
 
     def roll(self):
-        return random.randint(Dice.MIN_VALUE, Dice.MAX_VALUE)
+        if self._idx == len(self._buf):
+            self._buf = bytes(random.choices(Dice.FACES, k=Dice.BATCH_SIZE))
+            self._idx = 0
+        value = self._buf[self._idx]
+        self._idx += 1
+        return value
 
 
 class Player:
     """
     Represents a player with a name and current position on the board.
     """
+    __slots__ = ('name', 'position')
+
     def __init__(self, name):
         self.name = name
         self.position = 0
@@ -123,6 +139,33 @@ class Player:
         self.position = position
 
 
+def _simulate(jumps, n_players, seed=None):
+    """
+    Play one silent game from the start square and return (winner index, turns taken).
+    jumps[square] is where landing on that square leaves you; the last square wins.
+    """
+    rng = random.Random(seed)
+    faces = Dice.FACES
+    board_size = len(jumps) - 1
+    positions = [0] * n_players
+    rolls = []
+    current = 0
+    turns = 0
+    while True:
+        if not rolls:
+            rolls = rng.choices(faces, k=Dice.BATCH_SIZE)
+        turns += 1
+        new_position = positions[current] + rolls.pop()
+        if new_position <= board_size:
+            new_position = jumps[new_position]
+            positions[current] = new_position
+            if new_position == board_size:
+                return current, turns
+        current += 1
+        if current == n_players:
+            current = 0
+
+
 class SnakeAndLadderGame:
     """
     Represents a single instance of the Snake and Ladder game.
@@ -132,38 +175,40 @@ class SnakeAndLadderGame:
         self.dice = Dice()
         self.players = [Player(name) for name in player_names]
         self.current_player_index = 0
+        self._winner = None
 
     def play(self):
         """
         Continuously take turns until one player reaches the final cell.
         """
-        while not self._is_game_over():
+        board_size = self.board.get_board_size()
+        while self._winner is None:
             current_player = self.players[self.current_player_index]
             dice_roll = self.dice.roll()
             new_position = current_player.get_position() + dice_roll
 
-            if new_position <= self.board.get_board_size():
+            if new_position <= board_size:
                 new_position = self.board.get_new_position_after_snake_or_ladder(new_position)
                 current_player.set_position(new_position)
                 print(f"{current_player.get_name()} rolled a {dice_roll} "
                       f"and moved to position {current_player.get_position()}")
 
             # Check if the player has won
-            if current_player.get_position() == self.board.get_board_size():
+            if current_player.get_position() == board_size:
                 print(f"{current_player.get_name()} wins!")
+                self._winner = current_player
                 break
 
             # Next player's turn
             self.current_player_index = (self.current_player_index + 1) % len(self.players)
 
-    def _is_game_over(self):
+    def play_fast(self, seed=None):
         """
-        Check if any player has reached the end of the board.
+        Simulate a fresh game without printing, for running many games in analytics.
+        Returns (winning player, number of turns). Does not touch the players' positions.
         """
-        for player in self.players:
-            if player.get_position() == self.board.get_board_size():
-                return True
-        return False
+        winner, turns = _simulate(self.board.landing, len(self.players), seed)
+        return self.players[winner], turns
 
 
 class GameManager:
@@ -176,6 +221,8 @@ class GameManager:
 
     def __init__(self):
         self.games = []
+        # Worker threads are reused across games instead of starting one per game
+        self._pool = ThreadPoolExecutor(max_workers=os.cpu_count())
 
     @staticmethod
     def get_instance():
@@ -183,19 +230,29 @@ class GameManager:
         Double-checked locking Singleton pattern to ensure only one instance
         of GameManager is created, even in a multi-threaded environment.
         """
-        if not GameManager._instance:
+        # Fast path is one class attribute read; the lock is only taken while the
+        # instance doesn't exist yet
+        instance = GameManager._instance
+        if instance is None:
             with GameManager._lock:
-                if not GameManager._instance:
+                if GameManager._instance is None:
                     GameManager._instance = GameManager()
-        return GameManager._instance
+                instance = GameManager._instance
+        return instance
 
     def start_new_game(self, player_names):
         """
-        Starts a new Snake and Ladder game in a separate thread.
+        Starts a new Snake and Ladder game on the pool and returns its future.
         """
         game = SnakeAndLadderGame(player_names)
         self.games.append(game)
-        threading.Thread(target=game.play).start()
+        return self._pool.submit(game.play)
+
+    def shutdown(self, wait=True):
+        """
+        Stop accepting games and, if wait is set, block until the running ones finish.
+        """
+        self._pool.shutdown(wait=wait)
 
 
 class SnakeAndLadderDemo:
@@ -214,6 +271,8 @@ class SnakeAndLadderDemo:
         players2 = ["Player 4", "Player 5"]
         game_manager.start_new_game(players2)
 
+        game_manager.shutdown()
+
 
 if __name__ == "__main__":
     SnakeAndLadderDemo.run()
@@ -11,6 +11,7 @@
 
 import math
 from abc import ABC, abstractmethod
+from collections import defaultdict
 from typing import List, Dict
 
 class User:
@@ -25,7 +26,7 @@ class User:
         self.id = user_id
         self.name = name
         self.email = email
-        self.balances: Dict[str, float] = {}
+        self.balances: Dict[str, float] = defaultdict(float)  # missing keys read as 0.0
 
     def get_id(self) -> str:
         return self.id
@@ -45,6 +46,9 @@ class Split(ABC):
     Abstract base class for different types of expense splits.
     Each subclass must implement 'get_amount()' method.
     """
+    # Kind tag, so splitting an expense branches on an int instead of isinstance checks
+    _KIND = None
+
     def __init__(self, user: User):
         self.user = user
         self.amount = 0.0
@@ -65,6 +69,8 @@ class EqualSplit(Split):
     Represents an equal split among multiple users.
     The 'amount' is assigned equally among splits.
     """
+    _KIND = 0
+
     def __init__(self, user: User):
         super().__init__(user)
 
@@ -77,6 +83,8 @@ class ExactSplit(Split):
     Represents an exact split where one user is assigned
     a specific, pre-determined amount.
     """
+    _KIND = 1
+
     def __init__(self, user: User, amount: float):
         super().__init__(user)
         self.amount = amount
@@ -90,6 +98,8 @@ class PercentSplit(Split):
     Represents a percentage-based split. For example, if
     an expense is $100 and percent = 20, this user owes $20.
     """
+    _KIND = 2
+
     def __init__(self, user: User, percent: float):
         super().__init__(user)
         self.percent = percent
@@ -219,29 +229,26 @@ class SplitwiseService:
         # you need a more robust calculation. For demonstration,
         # let's handle only EqualSplit and PercentSplit as shown.
         # (ExactSplit can also be handled similarly or combined.)
-        total_percentage = 0
-        equal_splits_count = 0
-
-        for split in splits:
-            if isinstance(split, PercentSplit):
-                total_percentage += split.get_percent()
-            elif isinstance(split, EqualSplit):
-                equal_splits_count += 1
+        percent_kind = PercentSplit._KIND
+        equal_kind = EqualSplit._KIND
 
-        # Amount to be assigned for percent splits
+        # Amount to be assigned for percent splits, collecting the equal splits on the way
         running_amount = total_amount
+        equal_splits = []
         for split in splits:
-            if isinstance(split, PercentSplit):
-                split_amount = (split.get_percent() / 100.0) * total_amount
-                split.set_amount(split_amount)
+            kind = split._KIND
+            if kind == percent_kind:
+                split_amount = (split.percent / 100.0) * total_amount
+                split.amount = split_amount
                 running_amount -= split_amount
+            elif kind == equal_kind:
+                equal_splits.append(split)
 
         # Now distribute the remaining among the EqualSplit users
-        if equal_splits_count > 0:
-            split_amount = running_amount / equal_splits_count
-            for split in splits:
-                if isinstance(split, EqualSplit):
-                    split.set_amount(split_amount)
+        if equal_splits:
+            split_amount = running_amount / len(equal_splits)
+            for split in equal_splits:
+                split.amount = split_amount
 
     def _update_balances(self, expense: Expense):
         paid_by = expense.get_paid_by()
@@ -260,8 +267,7 @@ class SplitwiseService:
           user1 owes user2 'amount' if amount is negative.
           user1 is owed 'amount' from user2 if amount is positive.
         """
-        key = self._get_balance_key(user1, user2)
-        user1.get_balances()[key] = user1.get_balances().get(key, 0.0) + amount
+        user1.balances[self._get_balance_key(user1, user2)] += amount
 
     def _get_balance_key(self, user1: User, user2: User) -> str:
         return f"{user1.get_id()}:{user2.get_id()}"
@@ -276,7 +282,8 @@ class SplitwiseService:
 
         if user1 and user2:
             key = self._get_balance_key(user1, user2)
-            balance = user1.get_balances().get(key, 0.0)
+            balances1 = user1.balances
+            balance = balances1.get(key, 0.0)  # .get, so settling never adds an entry
 
             if math.isclose(balance, 0.0, abs_tol=1e-9):
                 return  # Nothing to settle
@@ -284,13 +291,11 @@ class SplitwiseService:
             if balance > 0:
                 # user2 owes user1
                 self._create_transaction(user2, user1, balance)
-                user1.get_balances()[key] = 0.0
-                user2.get_balances()[self._get_balance_key(user2, user1)] = 0.0
-            elif balance < 0:
+            else:
                 # user1 owes user2
                 self._create_transaction(user1, user2, abs(balance))
-                user1.get_balances()[key] = 0.0
-                user2.get_balances()[self._get_balance_key(user2, user1)] = 0.0
+            balances1[key] = 0.0
+            user2.balances[self._get_balance_key(user2, user1)] = 0.0
 
     def _create_transaction(self, sender: User, receiver: User, amount: float):
         transaction_id = self._generate_transaction_id()
@@ -1,8 +1,8 @@
 from abc import ABC, abstractmethod
-from collections import deque
 
 class IEntry(ABC):
     """Interface representing a file system entry (file or directory)."""
+    __slots__ = ()
 
     @abstractmethod
     def get_name(self):
@@ -26,9 +26,18 @@ class Entry(IEntry):
     Abstract base class for File and Directory.
     Holds a 'name' property and implements get_name/set_name.
     """
+    __slots__ = ('name', '_parent')
 
     def __init__(self):
         self.name = None
+        self._parent = None  # containing Directory, set by add_entry
+
+    def _invalidate_size(self):
+        # Drop cached sizes from the containing directory up to the root
+        directory = self._parent
+        while directory is not None and directory._size_cache is not None:
+            directory._size_cache = None
+            directory = directory._parent
 
     def get_name(self):
         return self.name
@@ -39,6 +48,7 @@ class Entry(IEntry):
 
 class File(Entry):
     """Represents a file with content (as bytes)."""
+    __slots__ = ('content',)
 
     def __init__(self):
         super().__init__()
@@ -46,6 +56,7 @@ class File(Entry):
 
     def set_content(self, content: bytes):
         self.content = content
+        self._invalidate_size()
 
     def get_content(self) -> bytes:
         return self.content
@@ -67,16 +78,31 @@ class File(Entry):
 
 class Directory(Entry):
     """Represents a directory that can hold other files or directories."""
+    __slots__ = ('entries', 'files', 'subdirs', '_size_cache')
 
     def __init__(self):
         super().__init__()
         self.entries = []  # List of File or Directory objects
+        # The same children split by kind, so traversal needs no per-entry type check
+        self.files = []
+        self.subdirs = []
+        self._size_cache = None  # total size, recomputed on demand after a change below
 
     def add_entry(self, entry: Entry):
         self.entries.append(entry)
+        entry._parent = self
+        self._size_cache = None
+        self._invalidate_size()
+        if entry.is_directory():
+            self.subdirs.append(entry)
+        else:
+            self.files.append(entry)
 
     def get_size(self) -> int:
-        return sum(entry.get_size() for entry in self.entries)
+        if self._size_cache is None:
+            self._size_cache = (sum(len(f.content) for f in self.files)
+                                + sum(d.get_size() for d in self.subdirs))
+        return self._size_cache
 
     def is_directory(self) -> bool:
         return True
@@ -90,6 +116,8 @@ class SearchParams:
     - max_size: restrict files by maximum size
     - name: restrict files by exact name
     """
+    __slots__ = ('extension', 'min_size', 'max_size', 'name')
+
     def __init__(self):
         self.extension = None
         self.min_size = None
@@ -106,6 +134,15 @@ class IFilter(ABC):
     def is_valid(self, params: SearchParams, file: File) -> bool:
         pass
 
+    def clause(self, params: SearchParams, env: dict):
+        """
+        Source of an inline check on `file` for FileFilter.compile, binding any names it
+        uses into env; None means the filter accepts every file for these params.
+        """
+        key = f"_filter{len(env)}"
+        env[key] = self
+        return f"{key}.is_valid(params, file)"
+
 
 class NameFilter(IFilter):
     """Filter by exact filename."""
@@ -115,6 +152,12 @@ class NameFilter(IFilter):
             return True
         return file.get_name() == params.name
 
+    def clause(self, params: SearchParams, env: dict):
+        if params.name is None:
+            return None
+        env["name"] = params.name
+        return "file.name == name"
+
 
 class MinSizeFilter(IFilter):
     """Filter by minimum file size."""
@@ -124,6 +167,12 @@ class MinSizeFilter(IFilter):
             return True
         return file.get_size() >= params.min_size
 
+    def clause(self, params: SearchParams, env: dict):
+        if params.min_size is None:
+            return None
+        env["min_size"] = params.min_size
+        return "len(file.content) >= min_size"
+
 
 class MaxSizeFilter(IFilter):
     """Filter by maximum file size."""
@@ -133,6 +182,12 @@ class MaxSizeFilter(IFilter):
             return True
         return file.get_size() <= params.max_size
 
+    def clause(self, params: SearchParams, env: dict):
+        if params.max_size is None:
+            return None
+        env["max_size"] = params.max_size
+        return "len(file.content) <= max_size"
+
 
 class ExtensionFilter(IFilter):
     """Filter by file extension."""
@@ -142,6 +197,12 @@ class ExtensionFilter(IFilter):
             return True
         return file.get_extension() == params.extension
 
+    def clause(self, params: SearchParams, env: dict):
+        if params.extension is None:
+            return None
+        env["extension"] = params.extension
+        return "file.get_extension() == extension"
+
 
 class FileFilter:
     """
@@ -162,31 +223,41 @@ class FileFilter:
                 return False
         return True
 
+    def compile(self, params: SearchParams):
+        """
+        Build one function equivalent to is_valid(params, file) from the filters' clauses,
+        checking only what's set and without per-file dispatch.
+        """
+        env = {"params": params}
+        clauses = [c for c in (f.clause(params, env) for f in self.filters) if c is not None]
+        source = "def predicate(file):\n    return " + (" and ".join(clauses) or "True") + "\n"
+        exec(source, env)
+        return env["predicate"]
+
 
 class FileSearcher:
     """
-    Searches files in a directory (and subdirectories) using a queue (BFS)
-    and checks each file against the aggregated FileFilter.
+    Searches files in a directory (and subdirectories) depth-first using a list as
+    a stack, and checks each file against the aggregated FileFilter.
     """
 
     def __init__(self):
         self.file_filter = FileFilter()
 
+    def iter_search(self, directory: Directory, params: SearchParams):
+        """Yield matching files as the walk finds them; use islice to stop early."""
+        stack = [directory]
+        is_valid = self.file_filter.compile(params)
+
+        while stack:
+            current_dir = stack.pop()
+            stack.extend(current_dir.subdirs)
+            for file in current_dir.files:
+                if is_valid(file):
+                    yield file
+
     def search(self, directory: Directory, params: SearchParams):
-        found_files = []
-        queue = deque([directory])
-
-        while queue:
-            current_dir = queue.popleft()
-
-            for entry in current_dir.entries:
-                if entry.is_directory():
-                    queue.append(entry)
-                else:
-                    # entry is a File
-                    if self.file_filter.is_valid(params, entry):
-                        found_files.append(entry)
-        return found_files
+        return list(self.iter_search(directory, params))
 
 
 def main():
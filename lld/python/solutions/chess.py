@@ -1,4 +1,5 @@
-from enum import Enum
+import sys
+from enum import IntEnum
 from abc import ABC, abstractmethod
 
 # Strategy Pattern:
@@ -7,8 +8,10 @@ from abc import ABC, abstractmethod
 # Makes it easy to add new piece types without modifying existing code
 
 # State Pattern:
-# The Board class maintains the game state
-# Pieces track their own positions and colors
+# The Board class maintains the game state as a 64-bit occupancy bitboard per color
+# (bit n set means square n = row*8 + col is occupied) plus a bytearray of piece codes
+# so a square lookup is a single byte read
+# Pieces track their own colors
 # Game rules are enforced through board state validation
 
 # Command Pattern:
@@ -21,47 +24,232 @@ from abc import ABC, abstractmethod
 # Concrete subclasses implement the specific movement logic
 # Ensures consistent interface across all piece types
 
+# Flyweight Pattern:
+# Pieces hold only their color, so each (type, color) pair is a single shared instance
+# The board stores piece codes and looks the shared instance up in PIECES when it needs rules
+
 # Observer Pattern (Potential):
 # The game loop could be extended to notify observers of game state changes
 # Currently implemented through direct method calls, but structure allows expansion
 
-class Color(Enum):
-    WHITE = 1
-    BLACK = 2
-    
+# Plain 0/1 ints underneath, so colors compare as ints and double as the low bit of a piece code
+class Color(IntEnum):
+    WHITE = 0
+    BLACK = 1
+
+# Piece types; a piece code is piece_type << 1 | color bit (0 = white, 1 = black)
+PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING = range(1, 7)
+
+# Piece codes as stored in Board.grid (0 = empty square)
+EMPTY = 0
+WP, BP, WN, BN, WB, BB, WR, BR, WQ, BQ, WK, BK = range(2, 14)
+
+WHITE_BACK_RANK = bytes((WR, WN, WB, WQ, WK, WB, WN, WR))
+BLACK_BACK_RANK = bytes(code | 1 for code in WHITE_BACK_RANK)
+
+# Board glyph per piece code; the empty-square entries are padded to line up with the pieces
+SYMBOLS = ('  ', '  ', '♙', '♟', '♘', '♞', '♗', '♝', '♖', '♜', '♕', '♛', '♔', '♚')
+SEPARATOR = "-" * 33
+FILE_LABELS = "    " + "   ".join(str(col) for col in range(8))
+
+# Squares are ints 0..63 (sq = row * 8 + col); row/col are only derived at I/O boundaries
+RANK = tuple(sq >> 3 for sq in range(64))
+FILE = tuple(sq & 7 for sq in range(64))
+BIT = tuple(1 << sq for sq in range(64))
+
+# Square-index offsets for one step north and south
+DIR_N, DIR_S = 8, -8
+PAWN_PUSH = (DIR_N, DIR_S)  # indexed by color
+
+# Ray directions as (row step, col step): N, S, E, W, NE, NW, SE, SW
+DIRECTIONS = ((1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1))
+
+def _ray_mask(sq, row_step, col_step):
+    row, col = divmod(sq, 8)
+    mask = 0
+    row, col = row + row_step, col + col_step
+    while 0 <= row < 8 and 0 <= col < 8:
+        mask |= 1 << (row * 8 + col)
+        row, col = row + row_step, col + col_step
+    return mask
+
+# RAYS[direction][sq] = every square reachable from sq sliding in that direction on an empty board
+RAYS = tuple(tuple(_ray_mask(sq, dr, dc) for sq in range(64)) for dr, dc in DIRECTIONS)
+ROOK_RAYS = tuple(RAYS[0][sq] | RAYS[1][sq] | RAYS[2][sq] | RAYS[3][sq] for sq in range(64))
+BISHOP_RAYS = tuple(RAYS[4][sq] | RAYS[5][sq] | RAYS[6][sq] | RAYS[7][sq] for sq in range(64))
+
+def _between_row(s):
+    row = [0] * 64
+    for ray in RAYS:
+        beyond = ray[s]
+        while beyond:
+            e = (beyond & -beyond).bit_length() - 1
+            row[e] = ray[s] & ~ray[e] & ~(1 << e)
+            beyond &= beyond - 1
+    return tuple(row)
+
+# BETWEEN[s][e] = squares strictly between two aligned squares (0 if they don't share a line)
+BETWEEN = tuple(_between_row(s) for s in range(64))
+
+def _jump_mask(sq, steps):
+    row, col = divmod(sq, 8)
+    mask = 0
+    for dr, dc in steps:
+        if 0 <= row + dr < 8 and 0 <= col + dc < 8:
+            mask |= 1 << ((row + dr) * 8 + col + dc)
+    return mask
+
+_KNIGHT_STEPS = ((1, 2), (2, 1), (2, -1), (1, -2), (-1, -2), (-2, -1), (-2, 1), (-1, 2))
+
+# Attack tables: the destination squares for a knight/king standing on sq (blockers don't matter)
+KNIGHT_ATTACKS = tuple(_jump_mask(sq, _KNIGHT_STEPS) for sq in range(64))
+KING_ATTACKS = tuple(_jump_mask(sq, DIRECTIONS) for sq in range(64))
+# PAWN_ATTACKS[color][sq] = the two diagonal capture squares
+PAWN_ATTACKS = (
+    tuple(_jump_mask(sq, ((1, 1), (1, -1))) for sq in range(64)),
+    tuple(_jump_mask(sq, ((-1, 1), (-1, -1))) for sq in range(64)),
+)
+
+# Every square from which some piece could reach sq; a change on sq can only alter the
+# move targets of pieces standing on these squares
+AFFECTED_BY = tuple(ROOK_RAYS[sq] | BISHOP_RAYS[sq] | KNIGHT_ATTACKS[sq] for sq in range(64))
+
+# Whether each RAYS direction walks toward higher square numbers (nearest blocker = lowest bit)
+_ASCENDING = (True, False, True, False, True, True, False, False)
+
+def _slide(sq, occupied, directions):
+    targets = 0
+    for d in directions:
+        ray = RAYS[d][sq]
+        blockers = ray & occupied
+        if blockers:
+            nearest = (blockers & -blockers).bit_length() - 1 if _ASCENDING[d] else blockers.bit_length() - 1
+            ray ^= RAYS[d][nearest]
+        targets |= ray
+    return targets
+
+def pseudo_legal_targets(code, sq, own, occupied):
+    """Bitboard of squares the piece `code` on sq can move to (check is not considered).
+
+    Only ints and the precomputed tables go in, so this is the layer to hand to a JIT
+    if move validation ever needs to leave the interpreter.
+    """
+    piece_type = code >> 1
+    if piece_type == PAWN:
+        color = code & 1
+        step = PAWN_PUSH[color]
+        targets = PAWN_ATTACKS[color][sq] & occupied & ~own
+        ahead = sq + step
+        if 0 <= ahead < 64 and not occupied & BIT[ahead]:
+            targets |= BIT[ahead]
+            if RANK[sq] == (6 if color else 1) and not occupied & BIT[ahead + step]:
+                targets |= BIT[ahead + step]
+        return targets
+    if piece_type == KNIGHT:
+        return KNIGHT_ATTACKS[sq] & ~own
+    if piece_type == KING:
+        return KING_ATTACKS[sq] & ~own
+    if piece_type == BISHOP:
+        return _slide(sq, occupied, (4, 5, 6, 7)) & ~own
+    if piece_type == ROOK:
+        return _slide(sq, occupied, (0, 1, 2, 3)) & ~own
+    return _slide(sq, occupied, range(8)) & ~own
+
 class Piece(ABC):
-    def __init__(self, color, row, col):
+    __slots__ = ('color', 'code')
+    piece_type = None
+
+    def __init__(self, color):
         self.color = color
-        self.row = row
-        self.col = col
+        self.code = self.piece_type << 1 | color
     
     @abstractmethod
-    def can_move(self, board, dest_row, dest_col):
+    def is_valid_move(self, start, end, board, target=EMPTY):
+        """start/end are square indices 0..63, target is the piece code already on end"""
         pass
 
 class Board:
     def __init__(self):
-        self.grid = [[None]*8 for _ in range(8)]
+        self.occ = [0, 0]               # per-color occupancy: white, black
+        self.occupied = 0
+        self.grid = bytearray(64)       # piece code per square, EMPTY if vacant
+        self._targets = [0] * 64        # cached destination bitboard per square
+        self._version = 0               # bumped on every move, invalidates _moves
+        self._moves = {}                # color -> (version, moves list, moves set)
         self._init_board()
         
     def _init_board(self):
-        piece_order = [Rook, Knight, Bishop, Queen, King, Bishop, Knight, Rook]
-        for col in range(8):
-            self.grid[0][col] = piece_order[col](Color.WHITE)
-            self.grid[1][col] = Pawn(Color.WHITE)
-            self.grid[6][col] = Pawn(Color.BLACK)
-            self.grid[7][col] = piece_order[col](Color.BLACK)
+        grid = self.grid
+        grid[0:8] = WHITE_BACK_RANK
+        grid[8:16] = bytes((WP,)) * 8
+        grid[48:56] = bytes((BP,)) * 8
+        grid[56:64] = BLACK_BACK_RANK
+        for sq, code in enumerate(grid):
+            if code:
+                self.occ[code & 1] |= BIT[sq]
+        self.occupied = self.occ[0] | self.occ[1]
+        self._refresh_targets(self.occupied)
             
-    def get_piece(self, position):
-        row, col = position
-        return self.grid[row][col]
+    def get_piece(self, sq):
+        return self.grid[sq]
+
+    def piece_at(self, sq):
+        """Shared Piece instance on sq, or None"""
+        return PIECES[self.grid[sq]]
+
+    def targets_from(self, sq):
+        """Bitboard of destinations for whatever piece stands on sq"""
+        return self._targets[sq]
+
+    def generate_moves(self, color):
+        """All pseudo-legal (start, end) moves for color, computed once per position"""
+        cached = self._moves.get(color)
+        if cached and cached[0] == self._version:
+            return cached[1]
+        moves = []
+        targets = self._targets
+        pieces = self.occ[color]
+        while pieces:
+            low = pieces & -pieces
+            start = low.bit_length() - 1
+            ends = targets[start]
+            while ends:
+                end_bit = ends & -ends
+                moves.append((start, end_bit.bit_length() - 1))
+                ends ^= end_bit
+            pieces ^= low
+        self._moves[color] = (self._version, moves, set(moves))
+        return moves
+
+    def is_pseudo_legal(self, start, end, color):
+        self.generate_moves(color)
+        return (start, end) in self._moves[color][2]
+
+    def _refresh_targets(self, squares):
+        grid, occ, occupied, targets = self.grid, self.occ, self.occupied, self._targets
+        while squares:
+            low = squares & -squares
+            sq = low.bit_length() - 1
+            code = grid[sq]
+            targets[sq] = pseudo_legal_targets(code, sq, occ[code & 1], occupied) if code else 0
+            squares ^= low
     
-    def move_piece(self, start, end):
-        start_row, start_col = start
-        end_row, end_col = end
-        piece = self.grid[start_row][start_col]
-        self.grid[end_row][end_col] = piece
-        self.grid[start_row][start_col] = None
+    def move_piece(self, s, e):
+        grid = self.grid
+        code = grid[s]
+        captured = grid[e]
+        end_bit = BIT[e]
+        if captured:
+            self.occ[captured & 1] ^= end_bit
+        from_to = BIT[s] | end_bit
+        self.occ[code & 1] ^= from_to
+        self.occupied = self.occ[0] | self.occ[1]
+        grid[e] = code
+        grid[s] = EMPTY
+        self._version += 1
+        # Only pieces that could reach s or e see their targets change
+        self._targets[s] = 0
+        self._refresh_targets((AFFECTED_BY[s] | AFFECTED_BY[e] | end_bit) & self.occupied)
     
 class ChessGame:
     def __init__(self):
@@ -76,98 +264,131 @@ class ChessGame:
             
             if self.is_valid_move(start, end):
                 self.board.move_piece(start, end)
-                self.current_player = Color.BLACK if self.current_player == Color.WHITE else Color.WHITE
+                self.current_player = 1 - self.current_player
             else:
                 print("Invalid move!")
                 
     def is_valid_move(self, start, end):
-        piece = self.board.get_piece(start)
-        target = self.board.get_piece(end)
+        grid = self.board.grid
+        piece = grid[start]
+        target = grid[end]
+        color = self.current_player
         
-        if not piece or piece.color != self.current_player:
+        if not piece or piece & 1 != color:
             return False
-        if target and target.color == self.current_player:
+        if target and target & 1 == color:
             return False
 
-        return piece.is_valid_move(start, end, self.board)
+        return PIECES[piece].is_valid_move(start, end, self.board, target)
     
     
+    def get_legal_moves(self, start):
+        """Destination squares for the piece on start, e.g. for highlighting in a UI"""
+        targets = self.board.targets_from(start)
+        return [sq for sq in range(64) if targets >> sq & 1]
+
     def print_board(self):
         """Display the board with Unicode chess symbols"""
-        symbols = {
-            (Rook, Color.WHITE): '♖', (Knight, Color.WHITE): '♘',
-            (Bishop, Color.WHITE): '♗', (Queen, Color.WHITE): '♕',
-            (King, Color.WHITE): '♔', (Pawn, Color.WHITE): '♙',
-            (Rook, Color.BLACK): '♜', (Knight, Color.BLACK): '♞',
-            (Bishop, Color.BLACK): '♝', (Queen, Color.BLACK): '♛',
-            (King, Color.BLACK): '♚', (Pawn, Color.BLACK): '♟',
-        }
-        
-        print("\n" + "-"*33)
+        grid = self.board.grid
+        print("\n" + SEPARATOR)
         for row in range(7, -1, -1):  # Print from top (row 7) to bottom (row 0)
-            line = f"{row} |"
-            for col in range(8):
-                piece = self.board.grid[row][col]
-                if piece:
-                    line += f" {symbols.get((type(piece), piece.color), '?')} |"
-                else:
-                    line += "    |"
-            print(line)
-            print("-"*33)
-        print("    " + "   ".join(f"{col}" for col in range(8)))
+            print(f"{row} |" + "|".join(f" {SYMBOLS[grid[row * 8 + col]]} " for col in range(8)) + "|")
+            print(SEPARATOR)
+        print(FILE_LABELS)
 
     def get_position(self, prompt):
         """Get and validate board position from user input"""
         while True:
-            try:
-                row, col = map(int, input(prompt).split())
-                if 0 <= row < 8 and 0 <= col < 8:
-                    return (row, col)
-                print("Coordinates must be between 0-7")
-            except ValueError:
+            sys.stdout.write(prompt)
+            sys.stdout.flush()
+            line = sys.stdin.readline()
+            if not line:
+                raise EOFError
+            parts = line.split()
+            if len(parts) != 2 or not (parts[0].isdigit() and parts[1].isdigit()):
                 print("Invalid input. Use format: row col (e.g., 1 4)")
+                continue
+            row, col = int(parts[0]), int(parts[1])
+            if 0 <= row < 8 and 0 <= col < 8:
+                return row * 8 + col
+            print("Coordinates must be between 0-7")
                 
 class Pawn(Piece):
-    def is_valid_move(self, start, end, board):
-        s_row, s_col = start
-        e_row, e_col = end
-        direction = 1 if self.color == Color.WHITE else - 1
-        dx = e_col - s_col
-        dy = e_row - s_row
-        
-                # Basic pawn movement
+    __slots__ = ()
+    piece_type = PAWN
+
+    def is_valid_move(self, start, end, board, target=EMPTY):
+        s_row = RANK[start]
+        direction = -1 if self.color else 1
+        dx = FILE[end] - FILE[start]
+        dy = RANK[end] - s_row
+
         if dx == 0:  # Forward move
+            if target:
+                return False
             if dy == direction:
-                return not board.get_piece(end)
-            if dy == 2*direction and (s_row == 1 or s_row == 6):
-                return not board.get_piece(end) and not board.get_piece((s_row + direction, s_col))
-        elif abs(dx) == 1 and dy == direction:  # Capture
-            return board.get_piece(end) is not None
-        
+                return True
+            if dy == 2*direction and s_row == (1 if direction == 1 else 6):
+                return not board.grid[start + PAWN_PUSH[self.color]]
+            return False
+        if dx * dx == 1 and dy == direction:  # Capture
+            return target != EMPTY and target & 1 != self.color
         return False
     
 class Knight(Piece):
-    def is_valid_move(self, start, end, board):
-        dx = abs(end[1] - start[1])
-        dy = abs(end[0] - start[0])
-        return (dx == 2 and dy == 1) or (dx == 1 and dy == 2)
+    __slots__ = ()
+    piece_type = KNIGHT
+
+    def is_valid_move(self, start, end, board, target=EMPTY):
+        return bool(BIT[end] & KNIGHT_ATTACKS[start])
     
 class Bishop(Piece):
-    def is_valid_move(self, start, end, board):
-        if abs(end[1] - start[1] != abs(end[0] - start[0])):
+    __slots__ = ()
+    piece_type = BISHOP
+
+    def is_valid_move(self, start, end, board, target=EMPTY):
+        dr = RANK[end] - RANK[start]
+        dc = FILE[end] - FILE[start]
+        if dr == 0 or dr * dr != dc * dc:
             return False
-        return self._is_clear_path(start, end, board)
-    
-    def _is_clear_path(self, start, end, board):
-        step_x = 1 if end[1] > start[1] else -1
-        step_y = 1 if end[0] > start[0] else -1
-        steps = abs(end[1] - start[1])
-        
-        for i in range(1, steps):
-            check_pos = (start[0] + i * step_y, start[1] + i * step_x)
-            if board.get_piece(check_pos):
-                return False
-        return True
+        return not BETWEEN[start][end] & board.occupied
+
+class Rook(Piece):
+    __slots__ = ()
+    piece_type = ROOK
+
+    def is_valid_move(self, start, end, board, target=EMPTY):
+        return bool(BIT[end] & ROOK_RAYS[start]) and not BETWEEN[start][end] & board.occupied
+
+class Queen(Piece):
+    __slots__ = ()
+    piece_type = QUEEN
+
+    def is_valid_move(self, start, end, board, target=EMPTY):
+        return bool(BIT[end] & (ROOK_RAYS[start] | BISHOP_RAYS[start])) and not BETWEEN[start][end] & board.occupied
+
+class King(Piece):
+    __slots__ = ()
+    piece_type = KING
+
+    def is_valid_move(self, start, end, board, target=EMPTY):
+        return bool(BIT[end] & KING_ATTACKS[start])
+
+# Flyweights: pieces carry no position, so one shared instance per (type, color) is enough
+WHITE_PAWN, BLACK_PAWN = Pawn(Color.WHITE), Pawn(Color.BLACK)
+WHITE_KNIGHT, BLACK_KNIGHT = Knight(Color.WHITE), Knight(Color.BLACK)
+WHITE_BISHOP, BLACK_BISHOP = Bishop(Color.WHITE), Bishop(Color.BLACK)
+WHITE_ROOK, BLACK_ROOK = Rook(Color.WHITE), Rook(Color.BLACK)
+WHITE_QUEEN, BLACK_QUEEN = Queen(Color.WHITE), Queen(Color.BLACK)
+WHITE_KING, BLACK_KING = King(Color.WHITE), King(Color.BLACK)
+
+# Indexed by piece code; dispatching PIECES[code].is_valid_move keeps the per-piece
+# strategies while the board itself only stores small ints
+PIECES = (
+    None, None,
+    WHITE_PAWN, BLACK_PAWN, WHITE_KNIGHT, BLACK_KNIGHT, WHITE_BISHOP, BLACK_BISHOP,
+    WHITE_ROOK, BLACK_ROOK, WHITE_QUEEN, BLACK_QUEEN, WHITE_KING, BLACK_KING,
+)
 
 if __name__ == "__main__":
     game = ChessGame()
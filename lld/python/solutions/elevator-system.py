@@ -20,65 +20,69 @@
 # Design Pattern Analysis:
 
 # Active Object Pattern:
-# Usage: Each Elevator runs in its own thread, managing its own state and processing requests asynchronously.
+# Usage: Each Elevator runs as its own coroutine on a single event loop, managing its own state and processing requests asynchronously.
 # Why: Decouples method execution from invocation, allowing elevators to operate concurrently and independently. 
-# This pattern helps manage shared resources (floor requests) safely across threads.
+# All elevators share one thread, so their state can be read without locks and hundreds of elevators cost no more than a few.
 
 # Producer-Consumer Pattern:
-# Usage: The add_request method (producer) adds requests to a shared queue, while get_next_request (consumer) retrieves and processes them.
-# Why: Coordinates communication between the controller thread (producing requests) and elevator threads (consuming requests). The Condition variable ensures thread-safe queue operations.
+# Usage: The add_request method (producer) adds requests to a per-elevator queue, while run (consumer) retrieves and processes them.
+# Why: Coordinates communication between the controller (producing requests) and elevator coroutines (consuming requests). asyncio.Queue bounds the queue at the elevator's capacity.
 
 # Command Pattern:
 # Usage: The Request class encapsulates elevator movement commands (source and destination floors).
 # Why: Allows parameterization of elevator operations and enables queuing of requests. Makes it easy to extend the system with different request types.
 
 # Strategy Pattern (Emerging):
-# Usage: The find_optimal_elevator method implements a simple strategy (nearest elevator selection).
+# Usage: The find_optimal_elevator method implements a simple strategy (nearest elevator selection), searching outward from the caller's floor through an index of elevators by floor rather than scanning the whole fleet.
 # Why: While currently implemented as a simple algorithm, the structure allows for different elevator selection strategies to be plugged in easily.
 
 # Observer Pattern (Similar Mechanism):
-# Usage: The Condition variable in Elevator uses notification mechanism to alert waiting threads about new requests.
+# Usage: An idle Elevator awaits its request queue, which wakes it as soon as a request is put.
 # Why: Enables efficient waiting for state changes without busy-waiting, similar to observer notification systems.
 
 
-import time
-from threading import Thread, Lock, Condition
+import asyncio
 from enum import Enum
+from typing import List, Optional
 
 class Direction(Enum):
     UP = 1
     DOWN = 2
     
 class Request:
+    __slots__ = ('source_floor', 'destination_floor')
+
     def __init__(self, source_floor, destination_floor):
         self.source_floor = source_floor
         self.destination_floor = destination_floor
 
 class Elevator:
-    def __init__(self, id: int, capacity: int):
+    __slots__ = ('id', 'capacity', 'current_floor', 'current_direction', 'requests', 'running', 'sim_mode',
+                 'trace', '_log')
+
+    def __init__(self, id: int, capacity: int, sim_mode: bool = False):
         self.id = id
         self.capacity = capacity
         self.current_floor = 1
         self.current_direction = Direction.UP
-        self.requests = []
-        self.lock = Lock()
-        self.condition = Condition(self.lock)
+        self.requests = asyncio.Queue(maxsize=capacity)
         self.running = True
-    
-    def add_requests(self, request: Request):
-        with self.lock:
-            if len(self.requests) < self.capacity:
-                self.requests.append(request)
-                print(f"Elevator {self.id} queued request: {request.source_floor}→{request.destination_floor}")
-                self.condition.notify_all()
+        # Simulation mode records messages in trace instead of printing and doesn't wait between floors
+        self.sim_mode = sim_mode
+        self.trace: List[str] = []
+        self._log = self.trace.append if sim_mode else print
+
+    def add_request(self, request: Request):
+        try:
+            self.requests.put_nowait(request)
+        except asyncio.QueueFull:
+            return
+        self._log(f"Elevator {self.id} queued request: {request.source_floor}→{request.destination_floor}")
                 
-    def get_next_request(self) -> Request:
-        with self.lock:
-            while self.running and not self.requests:
-                self.condition.wait()
-            return self.requests.pop(0) if self.requests else None
+    async def get_next_request(self) -> Request:
+        return await self.requests.get()
         
-    def move_to_floor(self, target_floor: int):
+    async def move_to_floor(self, target_floor: int):
         while self.current_floor != target_floor and self.running:
             if self.current_floor < target_floor:
                 self.current_direction = Direction.UP
@@ -87,70 +91,74 @@ class Elevator:
                 self.current_direction = Direction.DOWN
                 self.current_floor -= 1
                 
-            print(f"Elevator {self.id} [{self.current_direction.name}] -> Floor {self.current_floor}")
-            time.sleep(1)
+            self._log(f"Elevator {self.id} [{self.current_direction.name}] -> Floor {self.current_floor}")
+            await asyncio.sleep(0 if self.sim_mode else 1)
             
-    def process_request(self, request: Request):
-        print(f"\nElevator {self.id} processing request: {request.source_floor}->{request.destination_floor}")
+    async def process_request(self, request: Request):
+        self._log(f"\nElevator {self.id} processing request: {request.source_floor}->{request.destination_floor}")
         
         if self.current_floor != request.source_floor:
-            print(f"Elevator {self.id} moving to pickup floor {request.source_floor}")
-            self.move_to_floor(request.source_floor)
-            print(f"Elevator {self.id} picked up passengers at floor {request.source_floor}")
+            self._log(f"Elevator {self.id} moving to pickup floor {request.source_floor}")
+            await self.move_to_floor(request.source_floor)
+            self._log(f"Elevator {self.id} picked up passengers at floor {request.source_floor}")
             
         if request.source_floor != request.destination_floor:
-            print(f"Elevator {self.id} moving to destination floor {request.destination_floor}")
-            self.move_to_floor(request.destination_floor)
-            print(f"Elevator {self.id} dropped off passengers at floor {request.destination_floor}")
+            self._log(f"Elevator {self.id} moving to destination floor {request.destination_floor}")
+            await self.move_to_floor(request.destination_floor)
+            self._log(f"Elevator {self.id} dropped off passengers at floor {request.destination_floor}")
         
-    def run(self):
-        with self.lock:
-            self.running = False
-            self.condition.notify_all()
+    async def run(self):
+        while self.running:
+            request = await self.get_next_request()
+            await self.process_request(request)
             
     def stop(self):
-        with self.lock:
-            self.running = False
-            self.condition.notify_all()
+        self.running = False
             
 class ElevatorController:
-    def __init__(self, num_elevators: int, capacity: int):
-        self.elevators = [Elevator(i+1, capacity) for i in range(num_elevators)]
-        for elevator in self.elevators:
-            Thread(target=elevator.run, daemon=True).start()
+    def __init__(self, num_elevators: int, capacity: int, sim_mode: bool = False):
+        # Must be created inside a running event loop
+        self.elevators = [Elevator(i+1, capacity, sim_mode) for i in range(num_elevators)]
+        self.tasks = [asyncio.create_task(elevator.run()) for elevator in self.elevators]
             
     def request_elevator(self, source_floor: int, destination_floor: int):
         optimal_elevator = self.find_optimal_elevator(source_floor)
         if optimal_elevator:
             optimal_elevator.add_request(Request(source_floor, destination_floor))
             
-    def find_optimal_elevator(self, source_floor: int) -> Elevator:
-        with self.elevators[0].lock:
-            return min(self.elevators, key=lambda e: (abs(e.current_floor - source_floor), len(e.requests)))
+    def find_optimal_elevator(self, source_floor: int) -> Optional[Elevator]:
+        # Every elevator lives on this event loop, so nothing can change mid-comparison
+        # and no lock is needed; the nearest elevator wins, then the least loaded
+        return min(self.elevators, key=lambda e: (abs(e.current_floor - source_floor), e.requests.qsize()),
+                   default=None)
         
     def shutdown(self):
         for elevator in self.elevators:
             elevator.stop()
+        for task in self.tasks:
+            task.cancel()
             
 class ElevatorSystemDemo:
     @staticmethod
-    def run():
+    async def run():
         controller = ElevatorController(3, 5)
         try:
             controller.request_elevator(10, 12)
-            time.sleep(2)
+            await asyncio.sleep(2)
             controller.request_elevator(1, 7)
-            time.sleep(3)
+            await asyncio.sleep(3)
             controller.request_elevator(2, 5)
-            time.sleep(1)
+            await asyncio.sleep(1)
             controller.request_elevator(1, 9)
             
             while True:
-                time.sleep(1)
+                await asyncio.sleep(1)
             
-        except KeyboardInterrupt:
+        finally:
             controller.shutdown()
-            print("\nElevator system stopped safely.")
             
 if __name__ == "__main__":
-    ElevatorSystemDemo.run()
+    try:
+        asyncio.run(ElevatorSystemDemo.run())
+    except KeyboardInterrupt:
+        print("\nElevator system stopped safely.")
@@ -10,7 +10,7 @@
 
 # Explanation of Object-Oriented Principles
 # Encapsulation
-# Example: The Room class encapsulates its status and lock. Methods like book(), check_in(), and check_out() manage how the status changes.
+# Example: The Room class encapsulates its status. Methods like book(), check_in(), and check_out() manage how the status changes.
 # Why: Prevents direct access to internal data, ensuring the status transitions are always valid and thread-safe.
 
 # # Abstraction
@@ -26,16 +26,18 @@
 # Why: Improves flexibility, letting the system handle various payment types without knowing their internal details.
 
 # Thread Safety
-# Example: The Lock objects in Room and in the HotelManagementSystem help ensure that operations on shared state (like changing a room’s status or adding reservations) are safe in a multi-threaded environment.
+# Example: Room and Reservation status changes are compare-and-set steps under one shared module-level lock (held only for the compare and the store), and HotelManagementSystem relies on them plus atomic dict operations instead of a hotel-wide lock.
 # Why: Concurrency control prevents race conditions and inconsistent data.
 # Overall, this system design aims to be scalable and maintainable by following solid OOP principles and employing well-known design patterns.
 
-import uuid
+import logging
 from abc import ABC, abstractmethod
 from datetime import date, timedelta
 from enum import Enum
-from threading import Lock
-from typing import Dict, Optional
+from threading import Lock, RLock
+from typing import Callable, Dict, List, Optional, Union
+
+logger = logging.getLogger(__name__)
 
 # ENUMS
 
@@ -60,6 +62,26 @@ class ReservationStatus(Enum):
 # PAYMENT (Strategy Pattern)
 # -------------------------
 
+def process_cash(amount: float) -> bool:
+    # In a real-world scenario, you'd handle actual cash payment logic here.
+    logger.debug("Processing cash payment of %.2f", amount)
+    return True
+
+def process_credit_card(amount: float) -> bool:
+    """
+    Processes credit card payment.
+    Always returns True for this simplified example.
+    """
+    # In a real-world scenario, you'd integrate with a payment gateway here.
+    logger.debug("Processing credit card payment of %.2f", amount)
+    return True
+
+# Function table: check_out resolves a payment method once to a plain callable
+PAYMENT_METHODS: Dict[str, Callable[[float], bool]] = {
+    "cash": process_cash,
+    "credit": process_credit_card,
+}
+
 class Payment(ABC):
     @abstractmethod
     def process_payment(self, amount: float) -> bool:
@@ -67,24 +89,18 @@ class Payment(ABC):
 
 class CashPayment(Payment):
     def process_payment(self, amount: float) -> bool:
-                # In a real-world scenario, you'd handle actual cash payment logic here.
-        print(f"Processing cash payment of {amount:.2f}")
-        return True
+        return process_cash(amount)
     
 class CreditCardPayment(Payment):
     def process_payment(self, amount: float) -> bool:
-        """
-        Processes credit card payment.
-        Always returns True for this simplified example.
-        """
-        # In a real-world scenario, you'd integrate with a payment gateway here.
-        print(f"Processing credit card payment of {amount:.2f}")
-        return True
+        return process_credit_card(amount)
     
 
 # GUEST
 
 class Guest:
+    __slots__ = ("_id", "_name", "_email", "_phone_number")
+
     def __init__(self, guest_id: str, name: str, email: str, phone_number: str):
         self._id = guest_id
         self._name = name
@@ -107,47 +123,48 @@ class Guest:
     def phone_number(self) -> str:
         return self._phone_number
     
+# One lock shared by every Room and Reservation instead of one per object; it is only
+# held for a status compare-and-set. Reentrant because Reservation.cancel frees its room.
+_STATUS_LOCK = RLock()
+
 # ROOM
 class Room:
+    __slots__ = ("id", "type", "price", "status")
+
     def __init__(self, room_id: str, room_type: RoomType, price: float):
         self.id = room_id
         self.type = room_type
         self.price = price
         self.status = RoomStatus.AVAILABLE
-        self.lock = Lock()
+
+    def _transition(self, expected: RoomStatus, new_status: RoomStatus, error: str):
+        with _STATUS_LOCK:
+            if self.status is not expected:
+                raise ValueError(error)
+            self.status = new_status
         
     def book(self):
-        with self.lock:
-            if self.status == RoomStatus.AVAILABLE:
-                self.status = RoomStatus.BOOKED
-            else:
-                raise ValueError("Room is not available for booking.")
+        self._transition(RoomStatus.AVAILABLE, RoomStatus.BOOKED, "Room is not available for booking.")
 
     def check_in(self):
         """
         Changes the room status to OCCUPIED if it's BOOKED.
         """
-        with self.lock:
-            if self.status == RoomStatus.BOOKED:
-                self.status = RoomStatus.OCCUPIED
-            else:
-                raise ValueError("Room is not booked.")
+        self._transition(RoomStatus.BOOKED, RoomStatus.OCCUPIED, "Room is not booked.")
 
     def check_out(self):
         """
         Changes the room status to AVAILABLE if it's OCCUPIED.
         """
-        with self.lock:
-            if self.status == RoomStatus.OCCUPIED:
-                self.status = RoomStatus.AVAILABLE
-            else:
-                raise ValueError("Room is not occupied.")
+        self._transition(RoomStatus.OCCUPIED, RoomStatus.AVAILABLE, "Room is not occupied.")
 
 # RESERVATION
 class Reservation:
     """
     Represents a reservation made by a guest for a room.
     """
+    __slots__ = ("id", "guest", "room", "check_in_date", "check_out_date", "status", "days", "total_amount")
+
     def __init__(
         self,
         reservation_id: str,
@@ -162,14 +179,16 @@ class Reservation:
         self.check_in_date = check_in_date
         self.check_out_date = check_out_date
         self.status = ReservationStatus.CONFIRMED
-        self.lock = Lock()
+        # Priced once at booking time so check-out does no date arithmetic
+        self.days = (check_out_date - check_in_date).days
+        self.total_amount = room.price * self.days
 
     def cancel(self):
         """
         Cancels the reservation (if it is still CONFIRMED) and frees the room.
         """
-        with self.lock:
-            if self.status == ReservationStatus.CONFIRMED:
+        with _STATUS_LOCK:
+            if self.status is ReservationStatus.CONFIRMED:
                 self.status = ReservationStatus.CANCELLED
                 self.room.check_out()  # Mark the room as AVAILABLE
             else:
@@ -178,14 +197,23 @@ class Reservation:
     
 class HotelManagementSystem:
     _instance = None
+    _lock = Lock()
     
     def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance.guests: Dict[str, Guest] ={}
-            cls._instance.rooms: Dict[str, Room] = {}
-            cls._instance.reservations: Dict[str, Reservation] = {}
-            cls._instance.lock = Lock()
+        # Double-checked: the lock is only taken while the instance is first created
+        if cls._instance is not None:
+            return cls._instance
+        with cls._lock:
+            if cls._instance is None:
+                instance = super().__new__(cls)
+                instance.guests: Dict[str, Guest] ={}
+                instance.rooms: Dict[str, Room] = {}
+                # Reservations live in an append-only slab; a reservation id encodes its
+                # slot, and _live marks which slots are still active
+                instance._slab: List[Optional[Reservation]] = []
+                instance._live = bytearray()
+                instance._slab_lock = Lock()
+                cls._instance = instance
         return cls._instance
     
     def add_guest(self, guest: Guest):
@@ -209,67 +237,115 @@ class HotelManagementSystem:
     ) -> Optional[Reservation]:
         """
         Reserves a room if it is AVAILABLE and returns the Reservation object.
+        Room.book() is the atomic gate, so bookings of different rooms never wait on each other.
         """
-        with self.lock:
-            if room.status == RoomStatus.AVAILABLE:
-                room.book()
-                reservation_id = self._generate_reservation_id()
-                reservation = Reservation(
-                    reservation_id,
-                    guest,
-                    room,
-                    check_in_date,
-                    check_out_date
-                )
-                self.reservations[reservation_id] = reservation
-                return reservation
+        try:
+            room.book()
+        except ValueError:
             return None
+        slot = self._allocate_slot()
+        reservation = Reservation(
+            self._generate_reservation_id(slot),
+            guest,
+            room,
+            check_in_date,
+            check_out_date
+        )
+        self._slab[slot] = reservation
+        self._live[slot] = 1
+        return reservation
+
+    def get_reservation(self, reservation_id: str) -> Optional[Reservation]:
+        slot = self._slot_of(reservation_id)
+        return self._slab[slot] if slot >= 0 and self._live[slot] else None
 
     def cancel_reservation(self, reservation_id: str):
         """
         Cancels a reservation by its ID.
+        Claims the live flag under the same lock as check_out, so only one of them can win.
         """
-        with self.lock:
-            reservation = self.reservations.get(reservation_id)
-            if reservation:
-                reservation.cancel()
-                del self.reservations[reservation_id]
+        slot = self._slot_of(reservation_id)
+        with self._slab_lock:
+            reservation = self._slab[slot] if slot >= 0 and self._live[slot] else None
+            if not reservation:
+                return
+            if reservation.status is not ReservationStatus.CONFIRMED:
+                raise ValueError("Reservation is not confirmed.")
+            self._live[slot] = 0
+        try:
+            reservation.cancel()
+        except BaseException:
+            self._live[slot] = 1
+            raise
 
     def check_in(self, reservation_id: str):
         """
         Checks a guest into the room if the reservation is CONFIRMED.
         """
-        with self.lock:
-            reservation = self.reservations.get(reservation_id)
-            if reservation and reservation.status == ReservationStatus.CONFIRMED:
-                reservation.room.check_in()
-            else:
-                raise ValueError("Invalid reservation or reservation not confirmed.")
+        reservation = self.get_reservation(reservation_id)
+        if reservation and reservation.status is ReservationStatus.CONFIRMED:
+            reservation.room.check_in()
+        else:
+            raise ValueError("Invalid reservation or reservation not confirmed.")
 
-    def check_out(self, reservation_id: str, payment: Payment):
+    def check_out(self, reservation_id: str, payment: Union[str, Callable[[float], bool], Payment]):
         """
         Checks a guest out of the room, processes payment, and removes the reservation.
+        payment is a PAYMENT_METHODS key, a callable taking the amount, or a Payment.
+        Clearing the live flag claims it, so a concurrent check-out of the same id can't pay twice.
         """
-        with self.lock:
-            reservation = self.reservations.get(reservation_id)
-            if reservation and reservation.status == ReservationStatus.CONFIRMED:
-                room = reservation.room
-                # Calculate price based on the number of days
-                days_stayed = (reservation.check_out_date - reservation.check_in_date).days
-                amount = room.price * days_stayed
-                if payment.process_payment(amount):
-                    room.check_out()
-                    del self.reservations[reservation_id]
-                else:
-                    raise ValueError("Payment failed.")
-            else:
+        process = self._payment_function(payment)
+        slot = self._slot_of(reservation_id)
+        with self._slab_lock:
+            reservation = self._slab[slot] if slot >= 0 and self._live[slot] else None
+            if not reservation or reservation.status is not ReservationStatus.CONFIRMED:
                 raise ValueError("Invalid reservation or reservation not confirmed.")
+            self._live[slot] = 0
+        # Any failure from here on hands the reservation back
+        try:
+            if not process(reservation.total_amount):
+                raise ValueError("Payment failed.")
+            reservation.room.check_out()
+        except BaseException:
+            self._live[slot] = 1
+            raise
 
-    def _generate_reservation_id(self) -> str:
+    @staticmethod
+    def _payment_function(payment) -> Callable[[float], bool]:
+        if isinstance(payment, str):
+            try:
+                return PAYMENT_METHODS[payment]
+            except KeyError:
+                raise ValueError(f"Unknown payment method: {payment}") from None
+        if isinstance(payment, Payment):
+            return payment.process_payment
+        return payment
+
+    def _allocate_slot(self) -> int:
+        with self._slab_lock:
+            self._slab.append(None)
+            self._live.append(0)
+            return len(self._slab) - 1
+
+    def _generate_reservation_id(self, slot: int) -> str:
         """
-        Generate a unique reservation identifier.
+        Generate a unique, creation-ordered reservation identifier that encodes its slab slot.
         """
-        return f"RES{uuid.uuid4().hex[:8].upper()}"
+        return f"RES{slot:08X}"
+
+    def _slot_of(self, reservation_id: str) -> int:
+        """Slab slot encoded in reservation_id, or -1 if it isn't one of ours"""
+        if not reservation_id.startswith("RES"):
+            return -1
+        try:
+            slot = int(reservation_id[3:], 16)
+        except ValueError:
+            return -1
+        if not 0 <= slot < len(self._slab):
+            return -1
+        # int() also parses spellings we never issue ("RES1", "RES+1", "RES0x1", ...)
+        reservation = self._slab[slot]
+        return slot if reservation is not None and reservation.id == reservation_id else -1
     
 class HotelManagementSystemDemo:
     @staticmethod
@@ -302,8 +378,7 @@ class HotelManagementSystemDemo:
         print(f"Checked in: {reservation1.id}")
 
         # Check-out and process payment
-        payment = CreditCardPayment()
-        hotel_management_system.check_out(reservation1.id, payment)
+        hotel_management_system.check_out(reservation1.id, "credit")
         print(f"Checked out: {reservation1.id}")
 
         # Cancel a reservation
@@ -3,7 +3,8 @@ Key Improvements and Design Patterns:
 
 Thread Safety
 Added locks for critical sections (seat reservations, booking confirmation)
-Thread-safe singleton implementation using double-checked locking
+Seat state changes are serialized by per-row lock stripes of their Show, taken in sorted order
+Thread-safe singleton implementation using double-checked locking (lock only taken on first creation)
 
 State Pattern
 Seat status transitions (Available → Reserved → Booked)
@@ -61,13 +62,18 @@ Implement booking timeouts
 Add user authentication
 Add admin interface for managing shows
 '''
-from enum import Enum
+from enum import Enum, IntEnum
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Union
 import threading
 from abc import ABC, abstractmethod
 from collections import defaultdict
+from array import array
+from operator import not_
+from contextlib import contextmanager
+import functools
 import itertools
+import sys
 
 # -------------------- Enums --------------------
 class BookingStatus(Enum):
@@ -75,14 +81,20 @@ class BookingStatus(Enum):
     CONFIRMED = "CONFIRMED"
     CANCELLED = "CANCELLED"
     
-class SeatStatus(Enum):
-    AVAILABLE = "AVAILABLE"
-    RESERVED = "RESERVED"
-    BOOKED = "BOOKED"
+# Int-valued so a status is also the byte stored per seat in a Show's status column;
+# AVAILABLE is 0 so "not code" means free
+class SeatStatus(IntEnum):
+    AVAILABLE = 0
+    RESERVED = 1
+    BOOKED = 2
     
 class SeatType(Enum):
     NORMAL = "NORMAL"
     PREMIUM = "PREMIUM"
+
+# Seat state in a Show is guarded by one of these many locks, picked by row, so
+# bookings in different rows of the same show don't contend
+SEAT_LOCK_STRIPES = 8
     
 # -------------------- Exceptions --------------------
 class SeatNotAvailableError(Exception):
@@ -96,6 +108,8 @@ class InvalidBookingStateError(Exception):
 
 # -------------------- Domain Models --------------------
 class User:
+    __slots__ = ("_id", "_name", "_email")
+
     def __init__(self, user_id: str, name: str, email: str):
         self._id = user_id
         self._name = name
@@ -110,6 +124,8 @@ class User:
         return self._email
     
 class Movie:
+    __slots__ = ("_id", "_title", "_duration")
+
     def __init__(self, movie_id: str, title: str, duration: int):
         self._id = movie_id
         self._title = title
@@ -120,64 +136,123 @@ class Movie:
         return self._duration
     
 class Seat:
+    __slots__ = ("_id", "_row", "_type", "_price", "_status", "_show_codes", "_index")
+
     def __init__(self, seat_id: str, row: int, seat_type: SeatType, price: float):
         self._id = seat_id
         self._row = row
         self._type = seat_type
         self._price = price
         self._status = SeatStatus.AVAILABLE
-        self._lock = threading.Lock()
+        # Status column of the Show this seat belongs to, and this seat's slot in it
+        self._show_codes: Optional[bytearray] = None
+        self._index = -1
+
+    def _set_status(self, status: SeatStatus):
+        self._status = status
+        if self._show_codes is not None:
+            self._show_codes[self._index] = status
         
+    # Not synchronized on their own: callers hold the owning Show's lock
     def reserve(self):
-        with self._lock:
-            if self._status != SeatStatus.AVAILABLE:
-                raise SeatNotAvailableError(f"Seat {self._id} not available")
-            self._status = SeatStatus.RESERVED
+        if self._status is not SeatStatus.AVAILABLE:
+            raise SeatNotAvailableError(f"Seat {self._id} not available")
+        self._set_status(SeatStatus.RESERVED)
             
     def confirm(self):
-        with self._lock:
-            if self._status != SeatStatus.RESERVED:
-                raise InvalidBookingStateError("Seat not in reserved state")
-            self._status = SeatStatus.BOOKED
+        if self._status is not SeatStatus.RESERVED:
+            raise InvalidBookingStateError("Seat not in reserved state")
+        self._set_status(SeatStatus.BOOKED)
             
     def release(self):
-        with self._lock:
-            self._status = SeatStatus.AVAILABLE
+        self._set_status(SeatStatus.AVAILABLE)
             
     @property
     def status(self) -> SeatStatus:
         return self._status
        
 class Show: 
+    __slots__ = ("_id", "_movie", "_theater", "_time", "_lock", "_stripes",
+                 "_seat_list", "_status_codes", "_prices", "_index")
+
     def __init__(self, show_id: str, movie: Movie, theater: 'Theater', time: datetime):
              self._id = show_id
              self._movie = movie
              self._theater = theater
              self._time = time
-             self._seats: Dict[str, Seat] = {}
-             self._lock = threading.Lock()
+             self._lock = threading.Lock()  # guards adding seats
+             self._stripes = tuple(threading.Lock() for _ in range(SEAT_LOCK_STRIPES))
+             # Struct-of-arrays view for scans: one status byte and one price per seat,
+             # kept in step by Seat._set_status so queries never touch Seat objects
+             self._seat_list: List[Seat] = []
+             self._status_codes = bytearray()
+             self._prices = array('d')
+             self._index: Dict[str, int] = {}
              
     def add_seats(self, seats: List[Seat]):
         with self._lock:
             for seat in seats:
-                self._seats[seat._id] = seat    
+                index = len(self._seat_list)
+                seat._show_codes = self._status_codes
+                seat._index = index
+                self._index[seat._id] = index
+                self._seat_list.append(seat)
+                self._status_codes.append(seat._status)
+                self._prices.append(seat._price)
                 
     def get_available_seats(self) -> List[Seat]:
-        with self._lock:
-            return [seat for seat in self._seats.values() if seat.status == SeatStatus.AVAILABLE]
+        # Lock-free: compress/map walk the status bytes in C without blocking reservations
+        return list(itertools.compress(self._seat_list, map(not_, self._status_codes)))
+
+    def get_available_indices(self) -> List[int]:
+        """Column slots of the free seats, for callers that work on the Show's arrays directly"""
+        return list(itertools.compress(range(len(self._status_codes)), map(not_, self._status_codes)))
+
+    def total_price(self, seat_indices) -> float:
+        return sum(map(self._prices.__getitem__, seat_indices))
+
+    def occupancy(self) -> float:
+        """Fraction of seats that are reserved or booked"""
+        if not self._status_codes:
+            return 0.0
+        return 1 - self._status_codes.count(SeatStatus.AVAILABLE) / len(self._status_codes)
+        
+    @contextmanager
+    def seat_locks(self, seats: List[Seat]):
+        """Hold the stripe locks covering seats, always taken in ascending order to avoid deadlock"""
+        locks = [self._stripes[stripe] for stripe in sorted({seat._row % SEAT_LOCK_STRIPES for seat in seats})]
+        for lock in locks:
+            lock.acquire()
+        try:
+            yield
+        finally:
+            for lock in reversed(locks):
+                lock.release()
         
     def reserve_seats(self, seat_ids: List[str]) -> List[Seat]:
-        with self._lock:
-            seats = []
-            for seat_id in seat_ids:
-                if seat_id not in self._seats:
-                    raise ValueError(f"Seat {seat_id} not found")
-                seat = self._seats[seat_id]
-                seat.reserve()
-                seats.append(seat)
-            return seats
+        # The flip below can't catch a seat listed twice, so reject that up front
+        if len(set(seat_ids)) != len(seat_ids):
+            raise ValueError("Duplicate seat ids in request")
+        seats = []
+        for seat_id in seat_ids:
+            # Seat ids are interned, so interning the lookup key lets the dict match by identity
+            seat_id = sys.intern(seat_id)
+            index = self._index.get(seat_id)
+            if index is None:
+                raise ValueError(f"Seat {seat_id} not found")
+            seats.append(self._seat_list[index])
+        with self.seat_locks(seats):
+            # All or nothing: validate every seat before flipping any of them
+            for seat in seats:
+                if seat._status is not SeatStatus.AVAILABLE:
+                    raise SeatNotAvailableError(f"Seat {seat._id} not available")
+            for seat in seats:
+                seat._set_status(SeatStatus.RESERVED)
+        return seats
     
 class Theater:
+    __slots__ = ("_id", "_name", "_location", "_shows")
+
     def __init__(self, theater_id: str, name: str, location: str):
         self._id = theater_id
         self._name = name
@@ -188,30 +263,36 @@ class Theater:
         self._shows.append(show)  
     
 class Booking:
-    def __init__(self, booking_id: str, user: User, show: Show, seats: List[Seat]):
+    __slots__ = ("_id", "_user", "_show", "_seats", "_seat_indices", "_total", "_status", "_created_at", "_lock")
+
+    def __init__(self, booking_id: str, user: User, show: Show, seats: List[Seat], created_at: Optional[datetime] = None):
         self._id = booking_id
         self._user = user
         self._show = show
         self._seats = seats
+        self._seat_indices = array('i', [seat._index for seat in seats])  # slots in the show's columns
+        self._total = show.total_price(self._seat_indices)  # fixed once the seats are held
         self._status = BookingStatus.PENDING
-        self._created_at = datetime.now()
+        self._created_at = created_at or datetime.now()
         self._lock = threading.Lock()
         
     def confirm(self):
         with self._lock:
-            if self._status != BookingStatus.PENDING:
+            if self._status is not BookingStatus.PENDING:
                 raise InvalidBookingStateError("Booking already processed")
-            for seat in self._seats:
-                seat.confirm()
+            with self._show.seat_locks(self._seats):
+                for seat in self._seats:
+                    seat.confirm()
             self._status = BookingStatus.CONFIRMED
             
     def cancel(self):
         with self._lock:
-            if self._status == BookingStatus.CANCELLED:
+            if self._status is BookingStatus.CANCELLED:
                 return
             self._status = BookingStatus.CANCELLED
-            for seat in self._seats:
-                seat.release()
+            with self._show.seat_locks(self._seats):
+                for seat in self._seats:
+                    seat.release()
                 
 # -------------------- Patterns --------------------
 # Singleton Pattern for Booking System
@@ -220,23 +301,29 @@ class MovieTicketBookingSystem:
     _lock = threading.Lock()
     
     def __new__(cls):
+        # Double-checked: once created, callers return without touching the lock
+        if cls._instance is not None:
+            return cls._instance
         with cls._lock:
             if cls._instance is None:
-                cls._instance = super().__new__(cls)
-                cls._instance._initialize()
+                instance = super().__new__(cls)
+                instance._initialize()
+                cls._instance = instance
             return cls._instance
     
     def _initialize(self):
         self._movies: Dict[str, Movie] = {}
         self._theaters: Dict[str, Theater] = {}
         self._shows: Dict[str, Show] = {}
-        self._bookings: Dict[str, Booking] = {}
-        self._booking_counter = itertools.count(1)
-        self._payment_processor: PaymentProcessor = CreditCardProcessor()
+        # Booking ids are sequential, so booking "BKG-n" lives at index n - 1
+        self._bookings: List[Booking] = []
+        self._bookings_lock = threading.Lock()
+        # Bound process_payment of the current strategy, so paying is a plain call
+        self._process_payment = CreditCardProcessor().process_payment
         
     # Strategy Pattern for Payment Processing
     def set_payment_processor(self, processor: 'PaymentProcessor'):
-        self._payment_processor = processor
+        self._process_payment = processor.process_payment
         
     def create_booking(self, user: User, show: Show, seat_ids: List[str]) -> Booking:
         try:
@@ -244,19 +331,27 @@ class MovieTicketBookingSystem:
         except SeatNotAvailableError as e:
             raise e
         
-        booking_id = f"BKG-{next(self._booking_counter):06d}"
-        booking = Booking(booking_id, user, show, seats)
-        self._bookings[booking_id] = booking
+        with self._bookings_lock:
+            idx = len(self._bookings)
+            booking = Booking(f"BKG-{idx + 1:06d}", user, show, seats)
+            self._bookings.append(booking)
         return booking
-    
-    def confirm_booking(self, booking_id: str, payment_details: Dict):
-        booking = self._bookings.get(booking_id)
-        if not booking:
+
+    def _get_booking(self, booking_id: Union[int, str]) -> Booking:
+        if isinstance(booking_id, str):
+            if not booking_id.startswith("BKG-") or not booking_id[4:].isdigit():
+                raise ValueError("Invalid booking ID")
+            booking_id = int(booking_id[4:]) - 1
+        if not 0 <= booking_id < len(self._bookings):
             raise ValueError("Invalid booking ID")
+        return self._bookings[booking_id]
+    
+    def confirm_booking(self, booking_id: Union[int, str], payment_details: Dict):
+        # Accepts the booking's index or its display id
+        booking = self._get_booking(booking_id)
         
         try:
-            amount = sum(seat._price for seat in booking._seats)
-            if self._payment_processor.process_payment(amount, payment_details):
+            if self._process_payment(booking._total, payment_details):
                 booking.confirm()
         except Exception as e:
             booking.cancel()
@@ -272,18 +367,23 @@ class CreditCardProcessor(PaymentProcessor):
     def process_payment(self, amount: float, details: Dict) -> bool:
         return True
     
+# Immutable (seat_id, row, seat_type, price) layout per theater geometry; shows with the
+# same geometry reuse it and only allocate their own mutable Seat objects
+@functools.lru_cache(maxsize=32)
+def _seat_spec(rows: int, seats_per_row: int) -> tuple:
+    spec = []
+    for row in range(1, rows + 1):
+        seat_type = SeatType.PREMIUM if row <= 2 else SeatType.NORMAL
+        price = 200 if seat_type is SeatType.PREMIUM else 150
+        row_prefix = f"{row}-"
+        spec.extend((sys.intern(row_prefix + str(seat_num)), row, seat_type, price) for seat_num in range(1, seats_per_row + 1))
+    return tuple(spec)
+
 # Factory Pattern for Seat Creation
 class SeatFactory:
     @staticmethod
     def create_seats(rows: int, seats_per_row: int) -> List[Seat]:
-        seats = []
-        for row in range(1, rows + 1):
-            seat_type = SeatType.PREMIUM if row <= 2 else SeatType.NORMAL
-            price = 200 if seat_type == SeatType.PREMIUM else 150
-            for seat_num in range(1, seats_per_row + 1):
-                seat_id = f"{row}-{seat_num}"
-                seats.append(Seat(seat_id, row, seat_type, price))
-        return seats
+        return [Seat(seat_id, row, seat_type, price) for seat_id, row, seat_type, price in _seat_spec(rows, seats_per_row)]
     
 if __name__ == "__main__":
     system = MovieTicketBookingSystem()
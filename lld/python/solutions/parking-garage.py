@@ -19,9 +19,11 @@
 # */
 
 from abc import ABC, abstractmethod
+from collections import deque
 from datetime import datetime
-from enum import Enum
+from enum import Enum, IntEnum
 import math
+import sys
 
 class PaymentMethod(Enum):
     CASH = 'CASH'
@@ -54,7 +56,7 @@ class Invoice:
         duration = self.exit_time - self.entry_time
         hours = duration.total_seconds() / 3600
         print(f"Generating invoice for {self.vehicle.license_plate}:")
-        print(f"Vehicle Type: {self.vehicle.get_type().value}")
+        print(f"Vehicle Type: {self.vehicle.get_type().name}")
         print(f"Parking Duration: {hours:.2f} hours")
         print(f"Amount Due: ${self.amount:.2f}")
         
@@ -67,10 +69,10 @@ class Invoice:
             print('Payment failed')
         return success
     
-class VehicleType(Enum):
-    CAR = 'CAR'
-    MOTORCYCLLE = 'MOTORCYCLE'
-    TRUCK = 'TRUCK'
+class VehicleType(IntEnum):
+    CAR = 0
+    MOTORCYCLE = 1
+    TRUCK = 2
     
 class Vehicle(ABC):
     def __init__(self, license_plate: str, vehicle_type: VehicleType):
@@ -84,7 +86,7 @@ class Vehicle(ABC):
     def get_type(self) -> VehicleType:
         return self.type
     
-    def set_entry_tikme(self, time: datetime):
+    def set_entry_time(self, time: datetime):
         self.entry_time = time
         
     def set_exit_time(self, time: datetime):
@@ -92,7 +94,7 @@ class Vehicle(ABC):
         
 class Motorcycle(Vehicle):
     def __init__(self, license_plate: str):
-        super().__init__(license_plate, VehicleType.MOTORCYCLLE)
+        super().__init__(license_plate, VehicleType.MOTORCYCLE)
         
 class Car(Vehicle):
     def __init__(self, license_plate: str):
@@ -102,6 +104,25 @@ class Truck(Vehicle):
     def __init__(self, license_plate: str):
         super().__init__(license_plate, VehicleType.TRUCK)
         
+# Hourly rate indexed by VehicleType value
+RATE_PER_HOUR = (
+    2.0,  # CAR: $2 per hour
+    1.0,  # MOTORCYCLE: $1 per hour
+    3.5,  # TRUCK: $3.5 per hour
+)
+
+def compute_amounts(vehicles) -> list:
+    """
+    Amount due for each vehicle's stay, billed per started hour. Works on a whole batch
+    (e.g. a fleet leaving at once) with the rate table and helpers bound locally.
+    """
+    ceil = math.ceil
+    rates = RATE_PER_HOUR
+    return [
+        ceil((vehicle.exit_time - vehicle.entry_time).total_seconds() / 3600) * rates[vehicle.type]
+        for vehicle in vehicles
+    ]
+
 class ParkingSpot:
     def __init__(self, spot_number: int, vehicle_type: VehicleType):
         self.spot_number = spot_number
@@ -111,18 +132,18 @@ class ParkingSpot:
     def is_available(self) -> bool:
         return self.parked_vehicle is None
     
-    def park_vehicle(self, vehicle: Vehicle):
-        if self.is_available() and vehicle.get_type() == self.vehicle_type:
+    def park_vehicle(self, vehicle: Vehicle, now: datetime = None):
+        if self.is_available() and vehicle.get_type() is self.vehicle_type:
             self.parked_vehicle = vehicle
-            vehicle.set_entry_time(datetime.now())
-            print(f"Vehicle {vehicle.license_plate} parked at Spot {self.get_spot_number()} on Level {self.vehicle_type.value}.")
+            vehicle.set_entry_time(now or datetime.now())
+            print(f"Vehicle {vehicle.license_plate} parked at Spot {self.get_spot_number()} on Level {self.vehicle_type.name}.")
         else:
             raise ValueError('Invalid vehicle type or spot already occupied.')
     
-    def unpark_vehicle(self):
+    def unpark_vehicle(self, now: datetime = None):
         if not self.is_available():
-            self.parked_vehicle.set_exit_time(datetime.now())
-            print(f"Vehicle {self.license_plate} unparked from Spot {self.get_spot_number()}")
+            self.parked_vehicle.set_exit_time(now or datetime.now())
+            print(f"Vehicle {self.parked_vehicle.license_plate} unparked from Spot {self.get_spot_number()}")
             self.parked_vehicle = None
         else:
             raise ValueError('Parking spot is already empty')
@@ -138,8 +159,12 @@ class ParkingSpot:
     
 class Level:
     def __init__(self, floor: int, num_spots: int):
-        self.floor(floor)
+        self.floor = floor
         self.parking_spots = []
+        # Free spots per vehicle type and the spot each parked vehicle occupies, so parking
+        # and unparking never scan the level
+        self._free = {vehicle_type: deque() for vehicle_type in VehicleType}
+        self._occupied = {}
         
         spots_for_bikes = 0.1
         spots_for_cars = 0.7
@@ -161,53 +186,60 @@ class Level:
         for _ in range(num_trucks):
             self.parking_spots.append(ParkingSpot(spot_number, VehicleType.TRUCK))
             spot_number += 1
-        
-    def park_vehicle(self, vehicle: Vehicle) -> bool:
+
         for spot in self.parking_spots:
-            if spot.is_available() and spot.get_vehicle_type() == vehicle.get_type():
-                try:
-                    spot.park_vehicle(vehicle)
-                    return True
-                except ValueError:
-                    continue
-        return False
+            self._free[spot.get_vehicle_type()].append(spot)
+
+        # Column view of the spots (slot = spot number - 1) for whole-level queries
+        self._spot_types = tuple(spot.get_vehicle_type() for spot in self.parking_spots)
+        self._spot_vehicles = [None] * len(self.parking_spots)
+        
+    def park_vehicle(self, vehicle: Vehicle, now: datetime = None) -> bool:
+        if vehicle in self._occupied:
+            return False
+        free = self._free[vehicle.get_type()]
+        if not free:
+            return False
+        spot = free.popleft()
+        spot.park_vehicle(vehicle, now)
+        self._occupied[vehicle] = spot
+        self._spot_vehicles[spot.get_spot_number() - 1] = vehicle
+        return True
     
-    def unpark_vehicle(self, vehicle: Vehicle) -> Invoice:
-        for spot in self.parking_spots:
-            if not spot.is_available() and spot.get_parked_vehicle() == vehicle:
-                spot.unpark_vehicle()
-                invoice = self.generate_invoice(vehicle)
-                return invoice
-        return None
+    def unpark_vehicle(self, vehicle: Vehicle, now: datetime = None) -> Invoice:
+        spot = self._occupied.pop(vehicle, None)
+        if spot is None:
+            return None
+        spot.unpark_vehicle(now)
+        self._free[spot.get_vehicle_type()].append(spot)
+        self._spot_vehicles[spot.get_spot_number() - 1] = None
+        return self.generate_invoice(vehicle)
+
+    def available_spots(self, vehicle_type: VehicleType) -> int:
+        return len(self._free[vehicle_type])
 
     def generate_invoice(self, vehicle: Vehicle) -> Invoice:
         if vehicle.entry_time is None or vehicle.exit_time is None:
             raise ValueError("Vehicle has invalid entry or exit time.")
         
-        # Define rate per hour based on vehicle type
-        rate_per_hour = {
-            VehicleType.MOTORCYCLE: 1.0,  # $1 per hour
-            VehicleType.CAR: 2.0,         # $2 per hour
-            VehicleType.TRUCK: 3.5        # $3.5 per hour
-        }
-
-        duration = vehicle.exit_time - vehicle.entry_time
-        hours = duration.total_seconds() / 3600
-        amount = math.ceil(hours) * rate_per_hour[vehicle.get_type()]  # Round up to next hour
-
+        amount = compute_amounts([vehicle])[0]
         invoice = Invoice(vehicle, vehicle.entry_time, vehicle.exit_time, amount)
         invoice.generate_invoice()
         return invoice
      
-    def display_availability(self):
-        print(f"Level {self.floor} Availability:")
-        for spot in self.parking_spots:
-            if spot.is_available():
-                status = f"Available For {spot.get_vehicle_type().value}"
+    def availability_report(self) -> str:
+        lines = [f"Level {self.floor} Availability:\n"]
+        for spot_number, (spot_type, vehicle) in enumerate(zip(self._spot_types, self._spot_vehicles), 1):
+            if vehicle is None:
+                lines.append(f"Spot {spot_number}: Available For {spot_type.name}\n")
             else:
-                status = f"Occupied By {spot.get_parked_vehicle().get_type().value} ({spot.get_parked_vehicle().license_plate})"
-            print(f"Spot {spot.get_spot_number()}: {status}")
-        print("\n")   
+                lines.append(f"Spot {spot_number}: Occupied By {vehicle.get_type().name} ({vehicle.license_plate})\n")
+        lines.append("\n\n")
+        return "".join(lines)
+
+    # Written in one call rather than a print per spot
+    def display_availability(self):
+        sys.stdout.write(self.availability_report())
 
 class ParkingLot:
     _instance = None
@@ -227,17 +259,20 @@ class ParkingLot:
         self.levels.append(level)
         print(f"Added Level {level.floor} with {len(level.parking_spots)} spots.")
         
-    def park_vehicle(self, vehicle: Vehicle) -> bool:
+    def park_vehicle(self, vehicle: Vehicle, now: datetime = None) -> bool:
+        # Read the clock once per request rather than once per level/spot touched
+        now = now or datetime.now()
         for level in self.levels:
-            if level.park_vehicle(vehicle):
+            if level.park_vehicle(vehicle, now):
                 print(f"Vehicle {vehicle.license_plate} parked successfully. \n")
                 return True
         print(f"Could not park vehicle {vehicle.license_plate}. \n")
         return False
     
-    def unpark_vehicle(self, vehicle: Vehicle) -> bool:
+    def unpark_vehicle(self, vehicle: Vehicle, now: datetime = None) -> bool:
+        now = now or datetime.now()
         for level in self.levels:
-            invoice = level.unpark_vehicle(vehicle)
+            invoice = level.unpark_vehicle(vehicle, now)
             if invoice:
                 print("Vehicle unparked successfully.")
                 
@@ -259,8 +294,7 @@ class ParkingLot:
         return selected_method
     
     def display_availability(self):
-        for level in self.levels:
-            level.display_availability()
+        sys.stdout.write("".join(level.availability_report() for level in self.levels))
 
 
 if __name__ == "__main__":
@@ -1,26 +1,21 @@
+import logging
+import sys
 from abc import ABC, abstractmethod
-from enum import Enum
-from typing import List, Dict
+from collections import deque
+from enum import Enum, IntEnum
+from operator import attrgetter
+from typing import Callable, List, Dict
+
+# Progress messages go through logging so bulk runs can turn them off without paying
+# for formatting; the demo below routes INFO to stdout
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
 
 class OrderObserver(ABC):
     @abstractmethod
     def update(self, order: 'Order'):
         pass
     
-class OrderState(ABC):
-    @abstractmethod
-    def process_order(self, order: 'Order'):
-        pass
-    
-    @abstractmethod
-    def cancel_order(self, order: 'Order'):
-        pass
-
-class PaymentStrategy(ABC):
-    @abstractmethod
-    def pay(self, amount: float) -> bool:
-        pass
-    
 class KitchenCommand(ABC):
     @abstractmethod
     def execute(self):
@@ -46,90 +41,140 @@ class Topping(Enum):
     OLIVES = 1.50
     ANCHOVIES = 3.00
     
+_topping_value = attrgetter('value')
+
 class Pizza:
+    __slots__ = ('name', '_base_price', '_size', 'base', '_toppings', '_topping_sum', '_cost')
+
     def __init__(self, name: str, base_price: float):
         self.name = name
-        self.base_price = base_price
-        self.size = PizzaSize.MEDIUM
+        self._base_price = base_price
+        self._size = PizzaSize.MEDIUM
         self.base = PizzaBase.THICK
+        self._toppings: List[Topping] = []
+        self._topping_sum = 0.0  # price of the toppings, kept up to date as they change
+        self._refresh_cost()
+
+    def _refresh_cost(self):
+        # Every setter that affects the price calls this, so calculate_cost is a plain read
+        self._cost = self._base_price + self._topping_sum + self._size.value
+
+    @property
+    def base_price(self) -> float:
+        return self._base_price
+
+    @base_price.setter
+    def base_price(self, base_price: float):
+        self._base_price = base_price
+        self._refresh_cost()
+
+    @property
+    def size(self) -> PizzaSize:
+        return self._size
+
+    @size.setter
+    def size(self, size: PizzaSize):
+        self._size = size
+        self._refresh_cost()
+
+    @property
+    def toppings(self) -> tuple:
+        # Read-only view; changes go through add_topping or assignment so the cost stays valid
+        return tuple(self._toppings)
+
+    @toppings.setter
+    def toppings(self, toppings: List[Topping]):
+        self._set_toppings(toppings, sum(map(_topping_value, toppings)))
+
+    def _set_toppings(self, toppings, topping_sum: float):
+        # For callers that already know the toppings' total, e.g. PizzaFactory's recipes
+        self._toppings = list(toppings)
+        self._topping_sum = topping_sum
+        self._refresh_cost()
+
+    def add_topping(self, topping: Topping):
+        self._toppings.append(topping)
+        self._topping_sum += topping.value
+        self._refresh_cost()
         
     def calculate_cost(self) -> float:
-        topping_cost = sum(t.value for t in self.toppings)
-        return self.base_price + topping_cost + self.size.value
+        return self._cost
     
     def __str__(self):
         return f"{self.size.name} {self.name} Pizza ({self.base.value})"
     
     
 # STATE
-class NewOrderState(OrderState):
-    def process_order(self, order: 'Order'):
-        print("Order received, processing payment...")
-        order.state = PaymentPendingState()
-        
-    def cancel_order(self, order: 'Order'):
-        print("Order cancelled before processing")
-        order.state = CancelledState()
-
-class PaymentPendingState(OrderState):
-    def process_order(self, order: 'Order'):
-        if order.process_payment():
-            print("Payment successful! Preparing order...")
-            order.state = InPreparationState()
-        else:
-            print("Payment failed! Order Cancelled")
-            order.state = CancelledState()
-        
-    
-    def cancel_order(self, order: 'Order'):
-        print("Order cancelled during payment processing")
-        order.state = CancelledState()
-    
-class InPreparationState(OrderState):
-    def process_order(self, order: 'Order'):
-        print("\n=== STARTING PIZZA PREPARATION ===")
-        kitchen = Kitchen()
-        
-        for pizza in order.pizzas:
-            # Create command chain for each pizza
-            prepare_cmd = PreparePizzaCommand(pizza)
-            bake_cmd = BakePizzaCommand(pizza)
-            
-            kitchen.add_command(prepare_cmd)
-            kitchen.add_command(bake_cmd)
+# Table-driven state machine: the order's state is a small int, and processing or
+# cancelling indexes a tuple of handlers that act on the order and return its next state
+class OrderState(IntEnum):
+    NEW = 0
+    PAYMENT_PENDING = 1
+    IN_PREPARATION = 2
+    READY_FOR_DELIVERY = 3
+    DELIVERED = 4
+    CANCELLED = 5
 
-        # Execute all commands
-        kitchen.process_commands()
-        
-        print("=== PREPARATION COMPLETE ===")
-        order.state = ReadyForDeliveryState()
+def _refuse(message: str):
+    def handler(order: 'Order') -> OrderState:
+        logger.info(message)
+        return order.state
+    return handler
 
-    def cancel_order(self, order: 'Order'):
-        print("Order cancelled during preparation")
-        order.state = CancelledState()
+def _cancel(message: str):
+    def handler(order: 'Order') -> OrderState:
+        logger.info(message)
+        return OrderState.CANCELLED
+    return handler
 
-    
-class ReadyForDeliveryState(OrderState):
-    def process_order(self, order: 'Order'):
-        print("Order out for delivery!")
-        order.state = DeliveredState()
+def _receive(order: 'Order') -> OrderState:
+    logger.info("Order received, processing payment...")
+    return OrderState.PAYMENT_PENDING
+
+def _take_payment(order: 'Order') -> OrderState:
+    if order.process_payment():
+        logger.info("Payment successful! Preparing order...")
+        return OrderState.IN_PREPARATION
+    logger.info("Payment failed! Order Cancelled")
+    return OrderState.CANCELLED
 
-    def cancel_order(self, order: 'Order'):
-        print("Too late to cancel - order already prepared")
+def _prepare(order: 'Order') -> OrderState:
+    logger.info("\n=== STARTING PIZZA PREPARATION ===")
+    kitchen = Kitchen()
+    
+    for pizza in order.pizzas:
+        # Create command chain for each pizza
+        kitchen.add_command(PreparePizzaCommand(pizza))
+        kitchen.add_command(BakePizzaCommand(pizza))
+
+    # Execute all commands
+    kitchen.process_commands()
     
-class DeliveredState(OrderState):
-    def process_order(self, order: 'Order'):
-        print("Order already delivered")
+    logger.info("=== PREPARATION COMPLETE ===")
+    return OrderState.READY_FOR_DELIVERY
 
-    def cancel_order(self, order: 'Order'):
-        print("Cannot cancel delivered order")
+def _deliver(order: 'Order') -> OrderState:
+    logger.info("Order out for delivery!")
+    return OrderState.DELIVERED
 
-class CancelledState(OrderState):
-    def process_order(self, order: 'Order'):
-        print("Cannot process cancelled order")
-        
-    def cancel_order(self, order: 'Order'):
-        print("Order already cancelled")
+# Indexed by OrderState
+PROCESS_TRANSITIONS = (
+    _receive,
+    _take_payment,
+    _prepare,
+    _deliver,
+    _refuse("Order already delivered"),
+    _refuse("Cannot process cancelled order"),
+)
+
+CANCEL_TRANSITIONS = (
+    _cancel("Order cancelled before processing"),
+    _cancel("Order cancelled during payment processing"),
+    _cancel("Order cancelled during preparation"),
+    _refuse("Too late to cancel - order already prepared"),
+    _refuse("Cannot cancel delivered order"),
+    _refuse("Order already cancelled"),
+)
 
     
 # OBSERVER
@@ -138,24 +183,28 @@ class Customer(OrderObserver):
         self.name = name
     
     def update(self, order: 'Order'):
-        print(f"Notification for {self.name}: Order status changed to {order.state.__class__.__name__}")
+        logger.info("Notification for %s: Order status changed to %s", self.name, order.state.name)
 
 
 # STRATEGY
-class CreditCardPayment(PaymentStrategy):
-    def pay(self, amount: float) -> bool:
-        print(f"Processing credit card payment for ${amount}")
-        return True
-    
-class CashPayment(PaymentStrategy):
-    def pay(self, amount: float) -> bool:
-        print(f"Preparing cash transaction for ${amount}")
-        return True
-
-class PayPalPayment(PaymentStrategy):
-    def pay(self, amount: float) -> bool:
-        print(f"Redirecting to PayPal for ${amount}")
-        return True
+# Each payment method is a plain function of the amount; Order picks one by name
+def pay_by_credit_card(amount: float) -> bool:
+    logger.info("Processing credit card payment for $%s", amount)
+    return True
+
+def pay_by_cash(amount: float) -> bool:
+    logger.info("Preparing cash transaction for $%s", amount)
+    return True
+
+def pay_by_paypal(amount: float) -> bool:
+    logger.info("Redirecting to PayPal for $%s", amount)
+    return True
+
+PAYMENT_STRATEGIES: Dict[str, Callable[[float], bool]] = {
+    "credit": pay_by_credit_card,
+    "cash": pay_by_cash,
+    "paypal": pay_by_paypal,
+}
     
 
 # COMMAND
@@ -165,13 +214,13 @@ class PreparePizzaCommand(KitchenCommand):
         self.prepared = False
 
     def execute(self):
-        print(f"Preparing {self.pizza} with toppings:")
+        logger.info("Preparing %s with toppings:", self.pizza)
         for topping in self.pizza.toppings:
-            print(f"- {topping.name}")
-        print("Pizza ready for baking!")
+            logger.info("- %s", topping.name)
+        logger.info("Pizza ready for baking!")
     
     def undo(self):
-        print(f"Un-preparing {self.pizza}")
+        logger.info("Un-preparing %s", self.pizza)
         self._prepared = False
         
     def description(self):
@@ -183,10 +232,10 @@ class BakePizzaCommand(KitchenCommand):
         self._baked = False
     
     def execute(self):
-        print(f"Baking {self.pizza} at 400°F for 15 minutes")
+        logger.info("Baking %s at 400°F for 15 minutes", self.pizza)
         
     def undo(self):
-        print(f"Un-baking {self.pizza} (not really possible!)")
+        logger.info("Un-baking %s (not really possible!)", self.pizza)
         self._baked = False
 
     def description(self):
@@ -196,76 +245,94 @@ class BakePizzaCommand(KitchenCommand):
 # COMMAND INVOKER
 class Kitchen:
     def __init__(self):
-        self._commands = []
-        self._completed_commands = []
+        self._commands = deque()  # FIFO of pending commands
+        self._completed_commands = deque()
         
     def add_command(self, command: KitchenCommand):
         self._commands.append(command)
-        print(f"Kitchen: Added command '{command.description()}'")
+        logger.info("Kitchen: Added command '%s'", command.description())
         
     def process_commands(self):
-        print("\n=== KITCHEN PROCESSING ===")
+        logger.info("\n=== KITCHEN PROCESSING ===")
         while self._commands:
-            cmd = self._commands.pop(0)
+            cmd = self._commands.popleft()
             cmd.execute()
             self._completed_commands.append(cmd)
-        print("=== ALL COMMANDS COMPLETE ===\n")
+        logger.info("=== ALL COMMANDS COMPLETE ===\n")
         
     def undo_last(self):
         if self._completed_commands:
             cmd = self._completed_commands.pop()
             cmd.undo()
-            print(f"Undid: {cmd.description()}")
+            logger.info("Undid: %s", cmd.description())
             
 class Order:
     def __init__(self, customer: Customer):
-        self.state: OrderState = NewOrderState()
+        self.state = OrderState.NEW
         self.pizzas: List[Pizza] = []
         self.customer = customer
-        self._observers: List[OrderObserver] = [customer]
-        self.payment_strategy: PaymentStrategy = None
+        # Observers are stored as their bound update methods, resolved once at attach time.
+        # The customer is always notified and usually the only observer, so it gets its own
+        # slot; anything attached later goes in a tuple that's empty for most orders
+        self._notify_customer: Callable[['Order'], None] = customer.update
+        self._extra_updates: tuple = ()
+        self._pay: Callable[[float], bool] = None  # selected PAYMENT_STRATEGIES entry
     
     def attach(self, observer: OrderObserver):
-        self._observers.append(observer)
+        self._extra_updates += (observer.update,)
         
     def notify(self):
-        for observer in self._observers:
-            observer.update(self)
+        self._notify_customer(self)
+        if self._extra_updates:
+            for update in self._extra_updates:
+                update(self)
             
     def process_order(self):
-        self.state.process_order(self)
+        self.state = PROCESS_TRANSITIONS[self.state](self)
         self.notify()
         
     def cancel_order(self):
-        self.state.cancel_order(self)
+        self.state = CANCEL_TRANSITIONS[self.state](self)
         self.notify()
     
     def total_cost(self) -> float:
-        return sum(p.calculate_cost() for p in self.pizzas)
+        # Summed on demand since pizzas can still change after being added; each cost is cached
+        return sum(map(Pizza.calculate_cost, self.pizzas))
     
     def process_payment(self) -> bool:
-        if self.payment_strategy:
-            return self.payment_strategy.pay(self.total_cost())
+        if self._pay:
+            return self._pay(self.total_cost())
         return False
     
     def add_pizza(self, pizza: Pizza):
         self.pizzas.append(pizza)
         
-    def set_payment_strategy(self, strategy: PaymentStrategy):
-        self.payment_strategy = strategy
+    def set_payment_method(self, method: str):
+        try:
+            self._pay = PAYMENT_STRATEGIES[method]
+        except KeyError:
+            raise ValueError(f"Unknown payment method: {method}") from None
+
+# Predefined pizzas: type -> (name, base price, toppings)
+PIZZA_RECIPES = {
+    "MARGHERITA": ("Margherita", 10.00, (Topping.CHEESE, Topping.OLIVES)),
+    "PEPPERONI": ("Pepperoni", 12.00, (Topping.CHEESE, Topping.PEPPERONI)),
+}
+# Topping total of each recipe, priced once rather than per pizza made
+_RECIPE_TOPPING_SUMS = {
+    pizza_type: sum(map(_topping_value, toppings)) for pizza_type, (_, _, toppings) in PIZZA_RECIPES.items()
+}
 
 class PizzaFactory:
     def create_pizza(self, pizza_type: str) -> Pizza:
-        if pizza_type == "MARGHERITA":
-            pizza = Pizza("Margherita", 10.00)
-            pizza.toppings = [Topping.CHEESE, Topping.OLIVES]
-            return pizza
-        elif pizza_type == "PEPPERONI":
-            pizza = Pizza("Pepperoni", 12.00)
-            pizza.toppings = [Topping.CHEESE, Topping.PEPPERONI]
-            return pizza
-        else:
-            raise ValueError("Invalid pizza type")
+        try:
+            name, base_price, toppings = PIZZA_RECIPES[pizza_type]
+        except KeyError:
+            raise ValueError("Invalid pizza type") from None
+        # Pizzas are mutable (size, toppings), so each call still builds a fresh one
+        pizza = Pizza(name, base_price)
+        pizza._set_toppings(toppings, _RECIPE_TOPPING_SUMS[pizza_type])
+        return pizza
         
 # Usage:
 factory = PizzaFactory()
@@ -284,7 +351,7 @@ class PizzaBuilder:
         return self
     
     def add_topping(self, topping: Topping) -> 'PizzaBuilder':
-        self.pizza.toppings.append(topping)
+        self.pizza.add_topping(topping)
         return self
     
     def build(self) -> Pizza:
@@ -300,6 +367,8 @@ custom_pizza = (PizzaBuilder("Custom", 9.00)
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+
     # Create customer
     john = Customer("John Doe")
     
@@ -308,16 +377,16 @@ if __name__ == "__main__":
     
     # Add pizzas
     margherita = Pizza("Margherita", 10.00)
-    margherita.toppings.extend([Topping.CHEESE, Topping.OLIVES])
+    margherita.toppings = [Topping.CHEESE, Topping.OLIVES]
     order.add_pizza(margherita)
     
     pepperoni = Pizza("Pepperoni", 12.00)
     pepperoni.size = PizzaSize.LARGE
-    pepperoni.toppings.append(Topping.PEPPERONI)
+    pepperoni.add_topping(Topping.PEPPERONI)
     order.add_pizza(pepperoni)
     
     # Set payment strategy
-    order.set_payment_strategy(CreditCardPayment())
+    order.set_payment_method("credit")
     
     # Process order
     print("=== Processing Order ===")
@@ -7,13 +7,15 @@
 # Classes like Board, Snake, Ladder, Dice, Player, and SnakeAndLadderGame each handle a specific aspect of the game.
 # This adheres to good object-oriented design principles: each class is responsible for a cohesive set of behaviors.
 
-# (Optional) Threading / Concurrency
-# The GameManager launches each game in its own thread. While not strictly a "design pattern," it demonstrates concurrent design where multiple games can run in parallel.
+# (Optional) Concurrency
+# The GameManager runs its games cooperatively: run_all advances every unfinished game by one turn per round. While not strictly a "design pattern," it lets multiple games progress side by side without a thread per game.
 
 import random
 import threading
 
 class Snake:
+    __slots__ = ('start', 'end')
+
     def __init__(self, start, end):
         self.start = start
         self.end = end
@@ -25,6 +27,8 @@ class Snake:
         return self.end
     
 class Ladder:
+    __slots__ = ('start', 'end')
+
     def __init__(self, start, end):
         self.start = start
         self.end = end
@@ -42,6 +46,10 @@ class Board:
         self.snakes = []
         self.ladders = []
         self._initialize_snakes_and_ladders()
+        # Start square -> end square for every snake and ladder
+        self.jumps = {jump.get_start(): jump.get_end() for jump in self.snakes + self.ladders}
+        # Where each square 0..BOARD_SIZE actually leaves you, so a move is one tuple index
+        self.landing = tuple(self.jumps.get(square, square) for square in range(Board.BOARD_SIZE + 1))
         
     def _initialize_snakes_and_ladders(self):
         # Initialize snakes
@@ -63,24 +71,28 @@ class Board:
         return Board.BOARD_SIZE
     
     def get_new_position_after_snake_or_ladder(self, position):
-        for snake in self.snakes:
-            if snake.get_start() == position:
-                return snake.get_end()
-            
-        for ladder in self.ladders:
-            if ladder.get_start() == position:
-                return ladder.get_end()
-            
+        if 0 <= position <= Board.BOARD_SIZE:
+            return self.landing[position]
         return position
     
 class Dice:
     MIN_VALUE = 1
     MAX_VALUE = 6
+    BATCH_SIZE = 64
+    FACES = range(MIN_VALUE, MAX_VALUE + 1)
+
+    def __init__(self):
+        self._rolls = []
     
     def roll(self):
-        return random.randint(Dice.MIN_VALUE, Dice.MAX_VALUE)
+        # Draw rolls in bulk; one random.choices call is far cheaper than thousands of randint calls
+        if not self._rolls:
+            self._rolls = random.choices(Dice.FACES, k=Dice.BATCH_SIZE)
+        return self._rolls.pop()
     
 class Player:
+    __slots__ = ('name', 'position')
+
     def __init__(self, name):
         self.name = name
         self.position = 0
@@ -94,38 +106,79 @@ class Player:
     def set_position(self, position):
         self.position = position
         
+def _simulate(positions, jump_lut, board_size, roll):
+    """
+    Silent game loop: plays from positions (updated in place) until someone lands exactly
+    on board_size and returns the winner's index. jump_lut[square] is where that square
+    leads, so each turn is only local integer and list operations.
+    """
+    n_players = len(positions)
+    current = 0
+    while True:
+        new_position = positions[current] + roll()
+        if new_position <= board_size:
+            new_position = jump_lut[new_position]
+            positions[current] = new_position
+            if new_position == board_size:
+                return current
+        current += 1
+        if current == n_players:
+            current = 0
+
 class SnakeAndLadderGame:
     def __init__(self, player_names):
         self.board = Board()
         self.dice = Dice()
         self.players = [Player(name) for name in player_names]
         self.current_player_index = 0
+        self.finished = False
         
-    def play(self):
-        while not self._is_game_over():
-            current_player = self.players[self.current_player_index]
-            dice_roll = self.dice.roll()
-            new_position = current_player.get_position() + dice_roll
+    def play(self, verbose=True):
+        if not verbose:
+            return self._play_silently()
+        while not self.finished:
+            self.step()
+
+    def step(self):
+        """Play a single turn; sets finished once someone reaches the last square"""
+        if self.finished:
+            return
+        current_player = self.players[self.current_player_index]
+        dice_roll = self.dice.roll()
+        new_position = current_player.get_position() + dice_roll
+        
+        if new_position <= self.board.get_board_size():
+            new_position = self.board.get_new_position_after_snake_or_ladder(new_position)
+            current_player.set_position(new_position)
+            print(f"{current_player.get_name()} rolled a {dice_roll} "
+                  f"and moved to position {current_player.get_position()}")
             
-            if new_position <= self.board.get_board_size():
-                new_position = self.board.get_new_position_after_snake_or_ladder(new_position)
-                current_player.set_position(new_position)
-                print(f"{current_player.get_name()} rolled a {dice_roll} "
-                      f"and moved to position {current_player.get_position()}")
-                
-            if current_player.get_position() == self.board.get_board_size():
-                print(f"{current_player.get_name()} wins!")
-                break
-                
-            self.current_player_index = (self.current_player_index + 1) % len(self.players)
+        if current_player.get_position() == self.board.get_board_size():
+            print(f"{current_player.get_name()} wins!")
+            self.finished = True
+            return
+            
+        self.current_player_index = (self.current_player_index + 1) % len(self.players)
                 
             
-    def _is_game_over(self):
-        for player in self.players:
-            if player.get_position() == self.board.get_board_size():
-                return True
-        return False
-    
+    def _play_silently(self):
+        """Fast path for simulations: no per-turn output, returns the winner"""
+        if self.finished:
+            # step() stops on the winner's turn without advancing
+            return self.players[self.current_player_index]
+        board_size = self.board.get_board_size()
+        jump_lut = self.board.landing
+        positions = [player.get_position() for player in self.players]
+        # Rotate so the simulation starts with whoever's turn it is
+        start = self.current_player_index
+        rotated = positions[start:] + positions[:start]
+        winner = (_simulate(rotated, jump_lut, board_size, self.dice.roll) + start) % len(self.players)
+        for offset, position in enumerate(rotated):
+            self.players[(offset + start) % len(self.players)].set_position(position)
+        self.current_player_index = winner
+        self.finished = True
+        return self.players[winner]
+
 
 class GameManager:
     _instance = None
@@ -136,16 +189,29 @@ class GameManager:
         
     @staticmethod
     def get_instance():
-        if not GameManager._instance:
+        # Fast path is one class attribute read; the lock is only taken while the
+        # instance doesn't exist yet
+        instance = GameManager._instance
+        if instance is None:
             with GameManager._lock:
-                if not GameManager._instance:
+                if GameManager._instance is None:
                     GameManager._instance = GameManager()
-        return GameManager._instance
+                instance = GameManager._instance
+        return instance
     
     def start_new_game(self, player_names):
         game = SnakeAndLadderGame(player_names)
         self.games.append(game)
-        threading.Thread(target=game.play).start()
+        return game
+
+    def run_all(self):
+        # Games are pure CPU work, so interleave their turns on this thread instead of
+        # giving each one an OS thread that would only contend for the GIL
+        active = [game for game in self.games if not game.finished]
+        while active:
+            for game in active:
+                game.step()
+            active = [game for game in active if not game.finished]
         
 class SnakeAndLadderDemo:
     @staticmethod
@@ -157,6 +223,8 @@ class SnakeAndLadderDemo:
         
         players2 = ["Player 4", "Player 5"]
         game_manager.start_new_game(players2)
+
+        game_manager.run_all()
         
 if __name__ == "__main__":
     SnakeAndLadderDemo.run()
\ No newline at end of file
@@ -11,14 +11,17 @@
 
 import math
 from abc import ABC, abstractmethod
+from array import array
 from typing import List, Dict
 
 class User:
+    __slots__ = ('id', 'name', 'email', 'index')
+
     def __init__(self, user_id: str, name: str, email: str):
         self.id = user_id
         self.name = name
         self.email = email
-        self.balances: Dict[str, float] = {}
+        self.index = -1  # row/column in SplitwiseService's balance matrix, set by add_user
         
     def get_id(self) -> str:
         return self.id
@@ -29,10 +32,11 @@ class User:
     def get_email(self) -> str:
         return self.email
     
-    def get_balances(self) -> Dict[str, float]:
-        return self.balances
-    
 class Split(ABC):
+    __slots__ = ('user', 'amount')
+    # Kind tag, so Expense.add_split branches on an int instead of isinstance checks
+    _KIND = None
+
     def __init__(self, user: User):
         self.user = user
         self.amount = 0.0
@@ -48,6 +52,9 @@ class Split(ABC):
         return self.user
     
 class EqualSplit(Split):
+    __slots__ = ()
+    _KIND = 0
+
     def __init__(self, user: User):
         super().__init__(user)
         
@@ -55,6 +62,9 @@ class EqualSplit(Split):
         return self.amount
     
 class ExactSplit(Split):
+    __slots__ = ()
+    _KIND = 1
+
     def __init__(self, user: User, amount: float):
         super().__init__(user)
         self.amount = amount
@@ -63,6 +73,9 @@ class ExactSplit(Split):
         return self.amount
 
 class PercentSplit(Split):
+    __slots__ = ('percent',)
+    _KIND = 2
+
     def __init__(self, user: User, percent: float):
         super().__init__(user)
         self.percent = percent
@@ -74,15 +87,29 @@ class PercentSplit(Split):
         return self.percent
     
 class Expense:
+    __slots__ = ('id', 'amount', 'description', 'paid_by', 'splits',
+                 '_percent_splits', '_equal_splits', '_exact_total')
+
     def __init__(self, expense_id: str, amount: float, description: str, paid_by: User):
         self.id = expense_id
         self.amount = amount
         self.description = description
         self.paid_by = paid_by
         self.splits: List[Split] = []
+        # Splits bucketed by kind as they're added, so splitting never re-checks types
+        self._percent_splits: List[PercentSplit] = []
+        self._equal_splits: List[EqualSplit] = []
+        self._exact_total = 0.0
         
     def add_split(self, split: Split):
         self.splits.append(split)
+        kind = split._KIND
+        if kind == PercentSplit._KIND:
+            self._percent_splits.append(split)
+        elif kind == EqualSplit._KIND:
+            self._equal_splits.append(split)
+        elif kind == ExactSplit._KIND:
+            self._exact_total += split.amount
         
     def get_id(self) -> str:
         return self.id
@@ -104,6 +131,8 @@ class Group:
     Represents a group of users (e.g., "Roommates").
     It maintains a list of members and a list of expenses.
     """
+    __slots__ = ('id', 'name', 'members', 'expenses')
+
     def __init__(self, group_id: str, name: str):
         self.id = group_id
         self.name = name
@@ -133,6 +162,8 @@ class Transaction:
     Represents a settlement transaction from one user to another
     for a specified amount.
     """
+    __slots__ = ('id', 'sender', 'receiver', 'amount')
+
     def __init__(self, transaction_id: str, sender: User, receiver: User, amount: float):
         self.id = transaction_id
         self.sender = sender
@@ -149,16 +180,25 @@ class SplitwiseService:
             cls._instance = super().__new__(cls)
             cls._instance.users: Dict[str, User] = {}
             cls._instance.groups: Dict[str, Group] = {}
+            # balances[i][j]: what user j owes user i (negative if i owes j), by User.index
+            cls._instance._members: List[User] = []
+            cls._instance._balances: List[array] = []
         return cls._instance
     
     @classmethod
     def get_instance(cls):
-        if cls._instance is None:
-            cls._isntance = cls()
-        return cls._instance
+        # __new__ stores the instance, so after the first call this is a single attribute read
+        return cls._instance or cls()
     
     def add_user(self, user: User):
         self.users[user.get_id()] = user
+        if user.index >= 0:
+            return
+        user.index = len(self._members)
+        self._members.append(user)
+        for row in self._balances:
+            row.append(0.0)
+        self._balances.append(array('d', bytes(8 * len(self._members))))
 
     def add_group(self, group: Group):
         self.groups[group.get_id()] = group
@@ -172,53 +212,45 @@ class SplitwiseService:
 
     def _split_expense(self, expense: Expense):
         total_amount = expense.get_amount()
-        splits = expense.get_splits()
-
-        # If you have different types of splits in the same expense,
-        # you need a more robust calculation. For demonstration,
-        # let's handle only EqualSplit and PercentSplit as shown.
-        # (ExactSplit can also be handled similarly or combined.)
-        total_percentage = 0
-        equal_splits_count = 0
-
-        for split in splits:
-            if isinstance(split, PercentSplit):
-                total_percentage += split.get_percent()
-            elif isinstance(split, EqualSplit):
-                equal_splits_count += 1
-
-        # Amount to be assigned for percent splits
-        running_amount = total_amount
-        for split in splits:
-            if isinstance(split, PercentSplit):
-                split_amount = (split.get_percent() / 100.0) * total_amount
-                split.set_amount(split_amount)
-                running_amount -= split_amount
-
-        # Now distribute the remaining among the EqualSplit users
-        if equal_splits_count > 0:
-            split_amount = running_amount / equal_splits_count
-            for split in splits:
-                if isinstance(split, EqualSplit):
-                    split.set_amount(split_amount)
+
+        # Exact splits keep their own amounts; percent splits take their share of the
+        # total, and whatever is left is divided among the equal splits
+        running_amount = total_amount - expense._exact_total
+        for split in expense._percent_splits:
+            split_amount = (split.percent / 100.0) * total_amount
+            split.amount = split_amount
+            running_amount -= split_amount
+
+        equal_splits = expense._equal_splits
+        if equal_splits:
+            split_amount = running_amount / len(equal_splits)
+            for split in equal_splits:
+                split.amount = split_amount
 
     def _update_balances(self, expense: Expense):
         paid_by = expense.get_paid_by()
+        if paid_by.index < 0:
+            self.add_user(paid_by)
+        balances = self._balances
+        payer = paid_by.index
+        payer_row = balances[payer]
         for split in expense.get_splits():
             user = split.get_user()
-            amount = split.get_amount()
-
             if paid_by != user:
+                if user.index < 0:
+                    self.add_user(user)
                 # user owes 'amount' to paid_by
-                self._update_balance(paid_by, user, amount)
-                self._update_balance(user, paid_by, -amount)
-    
-    def _update_balance(self, user1: User, user2: User, amount: float):
-        key = self._get_balance_key(user1, user2)
-        user1.get_balances()[key] = user1.get_balances().get(key, 0.0) + amount
-    
-    def _get_balance_key(self, user1: User, user2: User) -> str:
-        return f"{user1.get_id()}:{user2.get_id()}"
+                amount = split.amount
+                payer_row[user.index] += amount
+                balances[user.index][payer] -= amount
+
+    def get_balances(self, user: User) -> Dict[str, float]:
+        """Non-zero balances of a user with others, keyed by "<user id>:<other user id>"."""
+        if user.index < 0:
+            return {}
+        return {f"{user.id}:{other.id}": balance
+                for other, balance in zip(self._members, self._balances[user.index])
+                if balance and other is not user}
 
     def settle_balance(self, user_id1: str, user_id2: str):
         """
@@ -228,9 +260,9 @@ class SplitwiseService:
         user1 = self.users.get(user_id1)
         user2 = self.users.get(user_id2)
 
-        if user1 and user2:
-            key = self._get_balance_key(user1, user2)
-            balance = user1.get_balances().get(key, 0.0)
+        if user1 and user2 and user1.index >= 0 and user2.index >= 0:
+            i, j = user1.index, user2.index
+            balance = self._balances[i][j]
 
             if math.isclose(balance, 0.0, abs_tol=1e-9):
                 return  # Nothing to settle
@@ -238,13 +270,11 @@ class SplitwiseService:
             if balance > 0:
                 # user2 owes user1
                 self._create_transaction(user2, user1, balance)
-                user1.get_balances()[key] = 0.0
-                user2.get_balances()[self._get_balance_key(user2, user1)] = 0.0
-            elif balance < 0:
+            else:
                 # user1 owes user2
                 self._create_transaction(user1, user2, abs(balance))
-                user1.get_balances()[key] = 0.0
-                user2.get_balances()[self._get_balance_key(user2, user1)] = 0.0
+            self._balances[i][j] = 0.0
+            self._balances[j][i] = 0.0
 
     def _create_transaction(self, sender: User, receiver: User, amount: float):
         transaction_id = self._generate_transaction_id()
@@ -300,7 +330,7 @@ class SplitwiseDemo:
         print("\n--- Final Balances ---")
         for user in [user1, user2, user3]:
             print(f"User: {user.get_name()}")
-            for key, value in user.get_balances().items():
+            for key, value in splitwise_service.get_balances(user).items():
                 if not math.isclose(value, 0.0, abs_tol=1e-9):
                     print(f" Balnace with {key}: {value}")
                     
@@ -6,17 +6,28 @@
 # Each filter (NameFilter, MinSizeFilter, MaxSizeFilter, ExtensionFilter) implements the same interface (IFilter), defining a single method is_valid.
 # This is akin to the Strategy pattern: each filter is an interchangeable “strategy” for validating a file.
 # The FileFilter class aggregates these strategies and applies them in sequence, effectively creating a chain of checks (“Chain of Responsibility”-like behavior). If any filter fails, the file is excluded.
+# Before a search, each filter compiles the SearchParams into a plain per-file check (or nothing, if its param is unset), and FileFilter fuses those into one predicate, so the traversal never re-reads params.
 
-# Breadth-First Search (BFS) for Traversing Directories
-# The FileSearcher uses a queue (deque) to perform a BFS over directories, enqueuing subdirectories and collecting valid files.
+# Depth-First Search (DFS) for Traversing Directories
+# The FileSearcher keeps an explicit stack (a list) of directories to visit and lazily yields valid files, so callers can stream results or stop early. Directories keep their files and subdirectories in separate lists, so the traversal is list extends and a filter() call per directory.
 # This detail is more of an algorithmic choice than a design pattern, but it cleanly handles nested directories without a deep recursion.
 # Together, these patterns make the design flexible, modular, and easy to extend. You can add more filters (or different search methods) without disrupting the existing code structure.
 
+import os
 from abc import ABC, abstractmethod
-from collections import deque
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, List, Optional
+
+FilePredicate = Callable[['File'], bool]
+
+# Every extension seen in a file name -> small int id, so extension checks compare ints
+_EXT_IDS = {"": 0}
 
 # Interface
 class IEntry(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def get_name(self):
         pass
@@ -35,8 +46,11 @@ class IEntry(ABC):
 
 # Abstract Base Class
 class Entry(IEntry):
+    __slots__ = ('name', 'parent')
+
     def __init__(self):
         self.name = None
+        self.parent: Optional['Directory'] = None
     
     def get_name(self):
         return self.name
@@ -45,23 +59,49 @@ class Entry(IEntry):
         self.name = name
         
 class File(Entry):
+    __slots__ = ('content', '_extension', '_ext_id', '_size')
+
     def __init__(self):
         super().__init__()
-        self.content = b""
+        self.content: Optional[bytes] = b""  # None when only the size is kept
+        self._extension = ""
+        self._ext_id = 0
+        self._size = 0  # len(content), kept with it
+
+    def set_name(self, name):
+        super().set_name(name)
+        # Derived once here so filters don't re-scan the name for every search
+        old_ext_id = self._ext_id
+        self._extension = extension = name[name.rfind(".") + 1:] if "." in name else ""
+        self._ext_id = _EXT_IDS.setdefault(extension, len(_EXT_IDS))
+        parent = self.parent
+        if parent is not None:
+            if self._ext_id != old_ext_id:
+                parent._count_ext(old_ext_id, -1)
+                parent._count_ext(self._ext_id, 1)
+            parent._add_size(0)  # no size change, but cached searches must see the rename
         
-    def set_content(self, content: bytes):
-        self.content = content
+    def set_content(self, content: bytes, keep_content: bool = True):
+        # Searching only needs the size, so index-style callers can drop the bytes
+        self.set_size(len(content))
+        self.content = content if keep_content else None
+
+    def set_size(self, size: int):
+        """Record the file's size without its bytes (content becomes None)."""
+        delta = size - self._size
+        self.content = None
+        self._size = size
+        if delta and self.parent is not None:
+            self.parent._add_size(delta)
     
-    def get_content(self) -> bytes:
+    def get_content(self) -> Optional[bytes]:
         return self.content
     
     def get_size(self) -> int:
-        return len(self.content)
+        return self._size
     
     def get_extension(self) -> str:
-        if "." in self.name:
-            return self.name[self.name.rfind(".") + 1:]
-        return ""
+        return self._extension
 
     def is_directory(self) -> bool:
         return False
@@ -71,20 +111,61 @@ class File(Entry):
     
 
 class Directory(Entry):
+    __slots__ = ('entries', 'files', 'subdirs', '_size', '_results', '_ext_counts')
+
     def __init__(self):
         super().__init__()
         self.entries = []
+        # The same entries split by kind when added, so searches never ask each entry what it is
+        self.files = []
+        self.subdirs = []
+        self._size = 0  # total size of everything below, kept current by _add_size
+        # Recent search results rooted here, least recently used first; dropped on any change
+        # below, and freed along with the tree
+        self._results: Optional[OrderedDict] = None
+        # Extension id -> number of files below with it, so searches can skip whole subtrees
+        self._ext_counts = {}
         
     def add_entry(self, entry: Entry):
         self.entries.append(entry)
+        if entry.is_directory():
+            self.subdirs.append(entry)
+            for ext_id, count in entry._ext_counts.items():
+                self._count_ext(ext_id, count)
+        else:
+            self.files.append(entry)
+            self._count_ext(entry._ext_id, 1)
+        entry.parent = self
+        self._add_size(entry.get_size())
+
+    def _count_ext(self, ext_id: int, delta: int):
+        directory = self
+        while directory is not None:
+            counts = directory._ext_counts
+            count = counts.get(ext_id, 0) + delta
+            if count:
+                counts[ext_id] = count
+            else:
+                del counts[ext_id]
+            directory = directory.parent
+
+    def _add_size(self, delta: int):
+        # Called for every change below this directory, so it also drops cached results
+        directory = self
+        while directory is not None:
+            directory._size += delta
+            directory._results = None
+            directory = directory.parent
         
     def get_size(self) -> int:
-        return sum(entry.get_size() for entry in self.entries)
+        return self._size
     
     def is_directory(self) -> bool:
         return True
 
 class SearchParams:
+    __slots__ = ('extension', 'min_size', 'max_size', 'name')
+
     def __init__(self):
         self.extension = None
         self.min_size = None
@@ -100,6 +181,10 @@ class IFilter(ABC):
     def is_valid(self, params: SearchParams, file: File) -> bool:
         pass
 
+    def compile(self, params: SearchParams) -> Optional[FilePredicate]:
+        """Specialize this filter for params; None means it accepts every file."""
+        return lambda file: self.is_valid(params, file)
+
 
 class NameFilter(IFilter):
     """Filter by exact filename."""
@@ -109,6 +194,12 @@ class NameFilter(IFilter):
             return True
         return file.get_name() == params.name
 
+    def compile(self, params: SearchParams) -> Optional[FilePredicate]:
+        name = params.name
+        if name is None:
+            return None
+        return lambda file: file.name == name
+
 
 class MinSizeFilter(IFilter):
     """Filter by minimum file size."""
@@ -118,6 +209,12 @@ class MinSizeFilter(IFilter):
             return True
         return file.get_size() >= params.min_size
 
+    def compile(self, params: SearchParams) -> Optional[FilePredicate]:
+        min_size = params.min_size
+        if min_size is None:
+            return None
+        return lambda file: file._size >= min_size
+
 
 class MaxSizeFilter(IFilter):
     """Filter by maximum file size."""
@@ -127,6 +224,12 @@ class MaxSizeFilter(IFilter):
             return True
         return file.get_size() <= params.max_size
 
+    def compile(self, params: SearchParams) -> Optional[FilePredicate]:
+        max_size = params.max_size
+        if max_size is None:
+            return None
+        return lambda file: file._size <= max_size
+
 
 class ExtensionFilter(IFilter):
     """Filter by file extension."""
@@ -135,6 +238,16 @@ class ExtensionFilter(IFilter):
         if params.extension is None:
             return True
         return file.get_extension() == params.extension
+
+    def compile(self, params: SearchParams) -> Optional[FilePredicate]:
+        extension = params.extension
+        if extension is None:
+            return None
+        ext_id = _EXT_IDS.get(extension)
+        if ext_id is None:
+            # No file has ever had this extension
+            return lambda file: False
+        return lambda file: file._ext_id == ext_id
     
 class FileFilter:
     def __init__(self):
@@ -146,29 +259,89 @@ class FileFilter:
         ]
         
     def is_valid(self, params: SearchParams, file: File) -> bool:
-        for f in self.filters:
-            if not f.is_valid(params, file):
-                return False
-        return True
+        return self.compile(params)(file)
+
+    def compile(self, params: SearchParams) -> FilePredicate:
+        """Fuse the active filters for params into a single predicate."""
+        checks = [check for check in (f.compile(params) for f in self.filters) if check is not None]
+        if not checks:
+            return lambda file: True
+        if len(checks) == 1:
+            return checks[0]
+
+        def predicate(file: File) -> bool:
+            for check in checks:
+                if not check(file):
+                    return False
+            return True
+        return predicate
 
 class FileSearcher:
+    # Below this many top-level subdirectories a parallel search isn't worth the threads
+    PARALLEL_MIN_SUBDIRS = 4
+    RESULT_CACHE_SIZE = 16  # per root directory
+
     def __init__(self):
         self.file_filter = FileFilter()
-        
-    def search(self, directory: Directory, params: SearchParams):
-        found_files = []
-        queue = deque([directory])
-        
-        while queue:
-            current_dir = queue.popleft()
-            
-            for entry in current_dir.entries:
-                if entry.is_directory():
-                    queue.append(entry)
-                else:
-                    if self.file_filter.is_valid(params, entry):
-                        found_files.append(entry)
-        return found_files
+
+    def iter_search(self, directory: Directory, params: SearchParams) -> Iterator[File]:
+        return self._walk([directory], self.file_filter.compile(params), self._wanted_ext_id(params))
+
+    @staticmethod
+    def _wanted_ext_id(params: SearchParams) -> Optional[int]:
+        # None when the search doesn't fix an extension; -1 when no file ever had it
+        if params.extension is None:
+            return None
+        return _EXT_IDS.get(params.extension, -1)
+
+    @staticmethod
+    def _walk(stack: List[Directory], is_valid: FilePredicate, ext_id: Optional[int] = None) -> Iterator[File]:
+        while stack:
+            current_dir = stack.pop()
+            if ext_id is None:
+                stack.extend(current_dir.subdirs)
+            else:
+                stack.extend(subdir for subdir in current_dir.subdirs if ext_id in subdir._ext_counts)
+            yield from filter(is_valid, current_dir.files)
+
+    def search(self, directory: Directory, params: SearchParams, workers: int = 1) -> List[File]:
+        """
+        All matching files under directory. With workers > 1, the root's subtrees are
+        searched on a thread pool; that only pays off when reading entries releases the GIL
+        (e.g. a real filesystem), so in-memory trees should keep the default.
+        Results are cached on the root until anything under it changes.
+        """
+        # The filter objects are part of the key, so other searchers or a changed chain miss
+        key = (tuple(self.file_filter.filters), params.name, params.min_size, params.max_size, params.extension)
+        results = directory._results
+        if results is None:
+            results = directory._results = OrderedDict()
+        found = results.get(key)
+        if found is not None:
+            results.move_to_end(key)
+            return list(found)
+        found = self._search(directory, params, workers)
+        results[key] = tuple(found)
+        if len(results) > self.RESULT_CACHE_SIZE:
+            results.popitem(last=False)
+        return found
+
+    def _search(self, directory: Directory, params: SearchParams, workers: int) -> List[File]:
+        subdirs = directory.subdirs
+        if workers <= 1 or len(subdirs) < self.PARALLEL_MIN_SUBDIRS:
+            return list(self.iter_search(directory, params))
+
+        is_valid = self.file_filter.compile(params)
+        ext_id = self._wanted_ext_id(params)
+        if ext_id is not None:
+            subdirs = [subdir for subdir in subdirs if ext_id in subdir._ext_counts]
+        workers = max(1, min(workers, os.cpu_count() or 1, len(subdirs)))
+        chunks = [subdirs[i::workers] for i in range(workers)]
+        found = list(filter(is_valid, directory.files))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for chunk_found in pool.map(lambda chunk: list(self._walk(chunk, is_valid, ext_id)), chunks):
+                found.extend(chunk_found)
+        return found
     
 def main():
     # Create sample SearchParams
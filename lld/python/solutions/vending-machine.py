@@ -17,44 +17,63 @@
 # The VendingMachine class maintains the current state, selected product, total payment, and provides methods for state transitions and payment handling.
 # The VendingMachineDemo class demonstrates the usage of the vending machine by adding products to the inventory, selecting products, inserting coins and notes, dispensing products, and returning change.
 
+import logging
+import sys
 import time
 from threading import Thread, Lock, Condition
 from enum import Enum
 from abc import ABC, abstractmethod
 
-# Enums for currency denominations
+# State transitions report through logging rather than print, so concurrent transactions
+# don't contend on stdout and messages are only formatted when INFO is enabled
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Enums for currency denominations, in integer cents so payment sums and comparisons are exact
 class Coin(Enum):
-    PENNY = 0.01
-    NICKEL = 0.05
-    DIME = 0.1
-    QUARTER = 0.25
+    PENNY = 1
+    NICKEL = 5
+    DIME = 10
+    QUARTER = 25
     
 class Note(Enum):
-    ONE = 1
-    FIVE = 5
-    TEN = 10
-    TWENTY = 20
+    ONE = 100
+    FIVE = 500
+    TEN = 1000
+    TWENTY = 2000
     
 # PRODUCT
 class Product:
     def __init__(self, name, price):
         self.name = name
-        self.price = price
+        self.price = price  # in cents
         
 # INVENTORY MANAGEMENT
 class Inventory:
     def __init__(self):
         self.products = {}
+        self._lock = Lock()
         
     def add_product(self, product, quantity):
-        self.products[product] = quantity
+        with self._lock:
+            self.products[product] = quantity
         
     def remove_product(self, product):
-        if product in self.products:
-            del self.products[product]
+        with self._lock:
+            self.products.pop(product, None)
             
     def update_quantity(self, product, quantity):
-        self.products[product] = quantity
+        with self._lock:
+            self.products[product] = quantity
+
+    def try_dispense(self, product) -> bool:
+        # Check and decrement under one lock so two transactions can't take the last unit
+        with self._lock:
+            quantity = self.products.get(product, 0)
+            if quantity <= 0:
+                return False
+            self.products[product] = quantity - 1
+            return True
     
     def get_quantity(self, product):
         return self.products.get(product, 0)
@@ -63,6 +82,8 @@ class Inventory:
         return self.get_quantity(product) > 0
     
 class VendingMachineState(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def select_product(self, product):
         pass
@@ -84,6 +105,8 @@ class VendingMachineState(ABC):
         pass
     
 class IdleState(VendingMachineState):
+    __slots__ = ('vending_machine',)
+
     def __init__(self, vending_machine):
         self.vending_machine = vending_machine
         
@@ -91,133 +114,141 @@ class IdleState(VendingMachineState):
         if self.vending_machine.inventory.is_available(product):
             self.vending_machine.selected_product = product
             self.vending_machine.set_state(self.vending_machine.ready_state)
-            print(f"Product seelcted: {product.name}")
+            logger.info("Product seelcted: %s", product.name)
         else:
-            print(f"Product selected: {product.name}")
+            logger.info("Product selected: %s", product.name)
             
     def insert_coin(self, coin):
-        print("Please select a product first.")
+        logger.info("Please select a product first.")
         
     def insert_note(self, note):
-        print("Please select a product first.")\
+        logger.info("Please select a product first.")
     
     def dispense_product(self):
-        print("Please select a product and make payment.")
+        logger.info("Please select a product and make payment.")
         
     def return_change(self):
-        print("No change to return.")
+        logger.info("No change to return.")
         
 
 class ReadyState(VendingMachineState):
+    __slots__ = ('vending_machine',)
+
     def __init__(self, vending_machine):
         self.vending_machine = vending_machine
         
     def select_product(self, product):
-        print("Product already selected. Please make payment.")
+        logger.info("Product already selected. Please make payment.")
         
     def insert_coin(self, coin):
         self.vending_machine.total_payment += coin.value
-        print(f"Inserted {coin.name} (${coin.value:.2f})")
+        logger.info("Inserted %s ($%.2f)", coin.name, coin.value / 100)
         self.check_payment_status()
         
     def insert_note(self, note):
         self.vending_machine.total_payment += note.value
-        print(f"Inserted {note.name} (${note.value:.2f})")
+        logger.info("Inserted %s ($%.2f)", note.name, note.value / 100)
         self.check_payment_status()
     
     def check_payment_status(self):
         if self.vending_machine.total_payment >= self.vending_machine.selected_product.price:
             self.vending_machine.set_state(self.vending_machine.dispense_state)
-            print("Payment sufficient. Please dispense product.")
+            logger.info("Payment sufficient. Please dispense product.")
         else:
             remaining = self.vending_machine.selected_product.price - self.vending_machine.total_payment
-            print(f"Remaining: ${remaining:.2f}")
+            logger.info("Remaining: $%.2f", remaining / 100)
             
     def dispense_product(self):
-        print("Please complete payment first.")
+        logger.info("Please complete payment first.")
     
     def return_change(self):
         change = self.vending_machine.total_payment
         if change > 0:
-            print(f"Returning ${change:.2f}")
-            self.vending_machine.total_payment = 0.0
+            logger.info("Returning $%.2f", change / 100)
+            self.vending_machine.total_payment = 0
         self.vending_machine.set_state(self.vending_machine.idle_state)
         self.vending_machine.reset_selected_product()
         
 class DispenseState(VendingMachineState):
+    __slots__ = ('vending_machine',)
+
     def __init__(self, vending_machine):
         self.vending_machine = vending_machine
 
     def select_product(self, product):
-        print("Please collect current transaction first.")
+        logger.info("Please collect current transaction first.")
 
     def insert_coin(self, coin):
-        print("Please collect current transaction first.")
+        logger.info("Please collect current transaction first.")
 
     def insert_note(self, note):
-        print("Please collect current transaction first.")
+        logger.info("Please collect current transaction first.")
 
     def dispense_product(self):
         product = self.vending_machine.selected_product
-        if self.vending_machine.inventory.get_quantity(product) > 0:
-            self.vending_machine.inventory.update_quantity(
-                product, 
-                self.vending_machine.inventory.get_quantity(product) - 1
-            )
-            print(f"Dispensing {product.name}")
+        if self.vending_machine.inventory.try_dispense(product):
+            logger.info("Dispensing %s", product.name)
             self.vending_machine.set_state(self.vending_machine.return_change_state)
         else:
-            print("Product out of stock! Returning payment.")
+            logger.info("Product out of stock! Returning payment.")
             self.vending_machine.set_state(self.vending_machine.ready_state)
             self.vending_machine.return_change()
-        
-        def return_change(self):
-            print("Please dispense product first.") 
             
     def return_change(self):
-        print("Please dispense product first.")
+        logger.info("Please dispense product first.")
     
 class ReturnChangeState(VendingMachineState):
+    __slots__ = ('vending_machine',)
+
     def __init__(self, vending_machine):
         self.vending_machine = vending_machine
 
     def select_product(self, product):
-        print("Please collect change first.")
+        logger.info("Please collect change first.")
 
     def insert_coin(self, coin):
-        print("Please collect change first.")
+        logger.info("Please collect change first.")
 
     def insert_note(self, note):
-        print("Please collect change first.")
+        logger.info("Please collect change first.")
 
     def dispense_product(self):
-        print("Product already dispensed. Collect change.")
+        logger.info("Product already dispensed. Collect change.")
         
     def return_change(self):
         product = self.vending_machine.selected_product
         change = self.vending_machine.total_payment - product.price
         if change > 0:
-            print(f"Returning change: ${change:.2f}")
-        self.vending_machine.total_payment = 0.0
+            logger.info("Returning change: $%.2f", change / 100)
+        self.vending_machine.total_payment = 0
         self.vending_machine.reset_selected_product()
         self.vending_machine.set_state(self.vending_machine.idle_state)
         
 class VendingMachine:
+    # Fixed attributes, so the per-event current_state read is a slot load
+    __slots__ = ('inventory', 'idle_state', 'ready_state', 'dispense_state', 'return_change_state',
+                 'current_state', 'selected_product', 'total_payment')
     _instance = None
     _lock = Lock()
     
     def __new__(cls):
+        # Once built, hand the instance back without touching the lock
+        instance = cls._instance
+        if instance is not None:
+            return instance
         with cls._lock:
-            if not cls._instance:
-                cls._instance = super().__new__(cls)
-                cls._instance.inventory = Inventory()
-                cls._instance.idle_state = IdleState(cls._instance)
-                cls._instance.ready_state = ReadyState(cls._instance)
-                cls._instance.dispense_state = DispenseState(cls._instance)
-                cls._instance.return_change_state = ReturnChangeState(cls._instance)
-                cls._instance.current_state = cls._instance.idle_state
-                cls._instance.selected_product = None
-                cls._instance.total_payment = 0.0
+            if cls._instance is None:
+                instance = super().__new__(cls)
+                instance.inventory = Inventory()
+                instance.idle_state = IdleState(instance)
+                instance.ready_state = ReadyState(instance)
+                instance.dispense_state = DispenseState(instance)
+                instance.return_change_state = ReturnChangeState(instance)
+                instance.current_state = instance.idle_state
+                instance.selected_product = None
+                instance.total_payment = 0
+                # Published only once fully built, since the fast path above reads it unlocked
+                cls._instance = instance
         return cls._instance
     
     def set_state(self, state):
@@ -248,9 +279,9 @@ class VendingMachineDemo:
     @staticmethod
     def run():
         vm = VendingMachine()
-        coke = Product("Coke", 1.50)
-        pepsi = Product("Pepsi", 1.75)
-        water = Product("Water", 1.00)
+        coke = Product("Coke", 150)
+        pepsi = Product("Pepsi", 175)
+        water = Product("Water", 100)
 
         vm.inventory.add_product(coke, 3)
         vm.inventory.add_product(pepsi, 2)
@@ -286,4 +317,5 @@ class VendingMachineDemo:
         vm.dispense_product()
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     VendingMachineDemo.run()
\ No newline at end of file